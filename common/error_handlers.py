@@ -20,19 +20,50 @@ Usage:
         return {"result": "success"}
 """
 
-import time
+import json
+import logging
 import functools
+import threading
+import traceback
+from types import MappingProxyType
 from typing import Optional, Dict, Any, Callable
-from flask import jsonify, request
+from flask import Response, request
 from werkzeug.exceptions import HTTPException
 
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode('utf-8')
+
+try:
+    from common.logger import get_logger as _get_logger, get_correlation_id as _get_correlation_id
+except ImportError:
+    # Logging is optional; fall back to no-ops so call sites need no checks
+    def _get_logger(name: str) -> None:
+        return None
+    
+    def _get_correlation_id() -> None:
+        return None
+
 
 # ============================================================================
 # CUSTOM EXCEPTION CLASSES
 # ============================================================================
 
+# Shared read-only stand-in for errors raised without any details
+_EMPTY_DETAILS = MappingProxyType({})
+
+
 class APIError(Exception):
     """Base exception class for all API errors"""
+    # status_code stays a class attribute so subclasses can override it;
+    # an explicit per-instance override lands in BaseException's own __dict__
+    __slots__ = ('message', '_details', '_cached')
+    
     status_code = 500
     error_type = "API_ERROR"
     
@@ -42,22 +73,56 @@ class APIError(Exception):
         self.message = message
         if status_code is not None:
             self.status_code = status_code
-        self.details = details or {}
+        self._details = details or None
+        self._cached = None
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Error details (read-only empty mapping when none were given)"""
+        return self._details if self._details is not None else _EMPTY_DETAILS
+    
+    def _add_detail(self, key: str, value: Any) -> None:
+        """Add a detail entry, allocating the details dict on first write"""
+        if self._details is None:
+            self._details = {}
+        self._details[key] = value
+        self._cached = None
+    
+    def __reduce__(self):
+        # Slots aren't part of BaseException's pickled state; every subclass
+        # accepts the message as its first argument and the rest is restored
+        # through __setstate__
+        return type(self), (self.message,), (self._details, getattr(self, '__dict__', None))
+    
+    def __setstate__(self, state):
+        self._details, extra = state
+        if extra:
+            self.__dict__.update(extra)
+    
+    def _payload(self) -> Dict[str, Any]:
+        """Cached response payload; callers must not mutate it"""
+        if self._cached is None:
+            error_dict = {
+                'error': self.error_type,
+                'message': self.message,
+                'status_code': self.status_code
+            }
+            if self.details:
+                error_dict['details'] = self.details
+            self._cached = error_dict
+        return self._cached
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for JSON response"""
-        error_dict = {
-            'error': self.error_type,
-            'message': self.message,
-            'status_code': self.status_code
-        }
-        if self.details:
-            error_dict['details'] = self.details
-        return error_dict
+        # Callers get a shallow copy so adding correlation_id never leaks
+        # back into the cached payload
+        return self._payload().copy()
 
 
 class ValidationError(APIError):
     """Raised when input validation fails"""
+    __slots__ = ()
+    
     status_code = 400
     error_type = "VALIDATION_ERROR"
     
@@ -65,11 +130,13 @@ class ValidationError(APIError):
                  details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details=details)
         if field:
-            self.details['field'] = field
+            self._add_detail('field', field)
 
 
 class DataFetchError(APIError):
     """Raised when external data fetching fails"""
+    __slots__ = ()
+    
     status_code = 503
     error_type = "DATA_FETCH_ERROR"
     
@@ -77,11 +144,13 @@ class DataFetchError(APIError):
                  details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details=details)
         if source:
-            self.details['source'] = source
+            self._add_detail('source', source)
 
 
 class DatabaseError(APIError):
     """Raised when database operations fail"""
+    __slots__ = ()
+    
     status_code = 500
     error_type = "DATABASE_ERROR"
     
@@ -89,11 +158,13 @@ class DatabaseError(APIError):
                  details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details=details)
         if operation:
-            self.details['operation'] = operation
+            self._add_detail('operation', operation)
 
 
 class RateLimitError(APIError):
     """Raised when rate limits are exceeded"""
+    __slots__ = ()
+    
     status_code = 429
     error_type = "RATE_LIMIT_ERROR"
     
@@ -102,17 +173,21 @@ class RateLimitError(APIError):
                  details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details=details)
         if retry_after:
-            self.details['retry_after_seconds'] = retry_after
+            self._add_detail('retry_after_seconds', retry_after)
 
 
 class ResourceNotFoundError(APIError):
     """Raised when requested resource is not found"""
+    __slots__ = ()
+    
     status_code = 404
     error_type = "RESOURCE_NOT_FOUND"
 
 
 class StrategyError(APIError):
     """Raised when strategy execution fails"""
+    __slots__ = ()
+    
     status_code = 500
     error_type = "STRATEGY_ERROR"
     
@@ -120,11 +195,13 @@ class StrategyError(APIError):
                  details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details=details)
         if strategy_name:
-            self.details['strategy'] = strategy_name
+            self._add_detail('strategy', strategy_name)
 
 
 class ServiceUnavailableError(APIError):
     """Raised when a dependent service is unavailable"""
+    __slots__ = ()
+    
     status_code = 503
     error_type = "SERVICE_UNAVAILABLE"
     
@@ -132,13 +209,185 @@ class ServiceUnavailableError(APIError):
                  details: Optional[Dict[str, Any]] = None):
         super().__init__(message, details=details)
         if service_name:
-            self.details['service'] = service_name
+            self._add_detail('service', service_name)
 
 
 # ============================================================================
 # ERROR HANDLER DECORATOR
 # ============================================================================
 
+# Log level, message prefix and traceback level per APIError family.
+# The most specific class in the exception's MRO wins; a None prefix
+# means the error_type is used instead. Tracebacks are attached only when
+# the logger is enabled for the traceback level (None = never). Upstream
+# failures are frequent during retry storms, so their tracebacks are
+# reserved for DEBUG.
+_API_ERROR_POLICY = {
+    ValidationError: (logging.WARNING, "Validation error", None),
+    ResourceNotFoundError: (logging.INFO, "Resource not found", None),
+    DataFetchError: (logging.ERROR, None, logging.DEBUG),
+    ServiceUnavailableError: (logging.ERROR, None, logging.DEBUG),
+    RateLimitError: (logging.ERROR, None, logging.DEBUG),
+    APIError: (logging.ERROR, None, logging.ERROR),
+}
+
+
+def _lookup(table: Dict[type, Any], cls: type) -> Any:
+    """Find the entry for the closest class in cls.__mro__"""
+    for base in cls.__mro__:
+        entry = table.get(base)
+        if entry is not None:
+            return entry
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _api_error_policy(cls: type) -> tuple:
+    """Resolve (and memoize) the log policy for an APIError class"""
+    return _lookup(_API_ERROR_POLICY, cls)
+
+
+def _fast_wraps(f: Callable, wrapper: Callable) -> Callable:
+    """
+    Lightweight functools.wraps: copy the identifying attributes only.
+    
+    Skips the __dict__ merge and __annotations__ copy, which Flask routing
+    never reads, to keep decoration cheap in apps with many endpoints.
+    """
+    wrapper.__module__ = getattr(f, '__module__', wrapper.__module__)
+    wrapper.__name__ = getattr(f, '__name__', wrapper.__name__)
+    wrapper.__qualname__ = getattr(f, '__qualname__', wrapper.__qualname__)
+    wrapper.__doc__ = getattr(f, '__doc__', None)
+    wrapper.__wrapped__ = f
+    return wrapper
+
+
+def _error_context():
+    """Resolve logger and correlation ID (only needed once an error occurs)"""
+    return _get_logger(__name__), _get_correlation_id()
+
+
+# Fixed error payloads, serialized once at import
+_NOT_FOUND_BODY = _dumps({
+    'error': 'NOT_FOUND',
+    'message': 'The requested resource was not found',
+    'status_code': 404
+})
+_METHOD_NOT_ALLOWED_BODY = _dumps({
+    'error': 'METHOD_NOT_ALLOWED',
+    'message': 'The method is not allowed for the requested URL',
+    'status_code': 405
+})
+_INTERNAL_ERROR_BODY = _dumps({
+    'error': 'INTERNAL_SERVER_ERROR',
+    'message': 'An unexpected error occurred',
+    'status_code': 500
+})
+
+
+def _with_correlation_id(body: bytes, correlation_id: Optional[str]) -> bytes:
+    """Append correlation_id to a serialized JSON object without re-encoding it"""
+    if not correlation_id:
+        return body
+    return body[:-1] + b',"correlation_id":' + _dumps(correlation_id) + b'}'
+
+
+def _error_body_response(body: bytes, status_code: int,
+                         correlation_id: Optional[str]) -> Response:
+    """Wrap a serialized error payload, tagged with the correlation ID"""
+    return Response(_with_correlation_id(body, correlation_id), status=status_code,
+                    mimetype='application/json')
+
+
+@functools.lru_cache(maxsize=16)
+def _http_error_body(code: int, description: str) -> bytes:
+    """Serialize (and memoize) the payload for a Werkzeug HTTP exception"""
+    return _dumps({
+        'error': 'HTTP_ERROR',
+        'message': description,
+        'status_code': code
+    })
+
+
+def _log_error(level: int, traceback_level: Optional[int], log_extra: Dict[str, Any],
+               msg: str, *args) -> Optional[str]:
+    """
+    Log an error with request context and return the current correlation ID.
+    
+    The message is %-formatted lazily and request attributes are only read
+    when the logger is enabled for the given level. The traceback is only
+    formatted when the logger is also enabled for traceback_level.
+    """
+    logger, correlation_id = _error_context()
+    if logger and logger.isEnabledFor(level):
+        # Resolve the LocalProxy once rather than per attribute
+        current_request = request._get_current_object()
+        log_extra['endpoint'] = current_request.endpoint
+        log_extra['method'] = current_request.method
+        log_extra['correlation_id'] = correlation_id
+        exc_info = traceback_level is not None and logger.isEnabledFor(traceback_level)
+        logger.log(level, msg, *args, extra=log_extra, exc_info=exc_info)
+    return correlation_id
+
+
+def _handle_api_error(e: APIError) -> Response:
+    """Handle custom API errors according to _API_ERROR_POLICY"""
+    level, prefix, traceback_level = _api_error_policy(type(e))
+    correlation_id = _log_error(
+        level, traceback_level,
+        {
+            'error_type': e.error_type,
+            'status_code': e.status_code,
+            'details': e._details
+        },
+        "%s: %s", prefix or e.error_type, e.message
+    )
+    
+    # Serialize the cached payload as-is; the correlation ID is spliced
+    # into the bytes so no per-error response dict is built
+    return _error_body_response(_dumps(e._payload()), e.status_code, correlation_id)
+
+
+def _handle_http_exception(e: HTTPException) -> Response:
+    """Handle Flask/Werkzeug HTTP exceptions"""
+    correlation_id = _log_error(
+        logging.WARNING, None,
+        {'status_code': e.code},
+        "HTTP error: %s", e.description
+    )
+    
+    # Built-in exceptions share a class-level description, so repeated
+    # 400/404/405s reuse the same serialized body
+    return _error_body_response(_http_error_body(e.code, e.description), e.code,
+                                correlation_id)
+
+
+def _handle_unexpected_error(e: Exception) -> Response:
+    """Catch-all for unexpected errors"""
+    correlation_id = _log_error(
+        logging.CRITICAL, logging.CRITICAL,
+        {'error_type': type(e).__name__},
+        "Unexpected error: %s", e
+    )
+    
+    # Don't expose internal error details in production
+    return _error_body_response(_INTERNAL_ERROR_BODY, 500, correlation_id)
+
+
+# Exception class -> response handler, resolved through the MRO
+_ERROR_HANDLERS = {
+    APIError: _handle_api_error,
+    HTTPException: _handle_http_exception,
+    Exception: _handle_unexpected_error,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _error_handler_for(cls: type) -> Callable:
+    """Resolve (and memoize) the response handler for an exception class"""
+    return _lookup(_ERROR_HANDLERS, cls)
+
+
 def handle_errors(f: Callable) -> Callable:
     """
     Decorator that handles exceptions and returns proper JSON error responses.
@@ -154,146 +403,27 @@ def handle_errors(f: Callable) -> Callable:
     
     Returns:
         JSON response with error details and appropriate HTTP status code
+    
+    Applying the decorator to a function it already wraps is a no-op, so
+    stacked usages don't add an extra call frame per request.
     """
-    @functools.wraps(f)
+    # functools.wraps in other decorators copies __dict__ onto outer
+    # wrappers, so the marker points at the wrapper itself and only counts
+    # when it is f
+    if getattr(f, '_handle_errors_wrapper', None) is f:
+        return f
+    
     def decorated_function(*args, **kwargs):
         try:
-            # Get logger if available
-            logger = None
-            try:
-                from common.logger import get_logger, get_correlation_id
-                logger = get_logger(__name__)
-                correlation_id = get_correlation_id()
-            except ImportError:
-                correlation_id = None
-            
-            # Execute the wrapped function
             return f(*args, **kwargs)
-            
-        except ValidationError as e:
-            # Log validation errors at warning level
-            if logger:
-                logger.warning(
-                    f"Validation error: {e.message}",
-                    extra={
-                        'error_type': e.error_type,
-                        'status_code': e.status_code,
-                        'details': e.details,
-                        'endpoint': request.endpoint,
-                        'method': request.method,
-                        'correlation_id': correlation_id
-                    }
-                )
-            
-            response = e.to_dict()
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-            return jsonify(response), e.status_code
-            
-        except ResourceNotFoundError as e:
-            # Log not found errors at info level
-            if logger:
-                logger.info(
-                    f"Resource not found: {e.message}",
-                    extra={
-                        'error_type': e.error_type,
-                        'status_code': e.status_code,
-                        'endpoint': request.endpoint,
-                        'correlation_id': correlation_id
-                    }
-                )
-            
-            response = e.to_dict()
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-            return jsonify(response), e.status_code
-            
-        except (DataFetchError, ServiceUnavailableError, RateLimitError) as e:
-            # Log external service errors at error level
-            if logger:
-                logger.error(
-                    f"{e.error_type}: {e.message}",
-                    extra={
-                        'error_type': e.error_type,
-                        'status_code': e.status_code,
-                        'details': e.details,
-                        'endpoint': request.endpoint,
-                        'correlation_id': correlation_id
-                    },
-                    exc_info=True
-                )
-            
-            response = e.to_dict()
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-            return jsonify(response), e.status_code
-            
-        except APIError as e:
-            # Log all other API errors at error level
-            if logger:
-                logger.error(
-                    f"{e.error_type}: {e.message}",
-                    extra={
-                        'error_type': e.error_type,
-                        'status_code': e.status_code,
-                        'details': e.details,
-                        'endpoint': request.endpoint,
-                        'correlation_id': correlation_id
-                    },
-                    exc_info=True
-                )
-            
-            response = e.to_dict()
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-            return jsonify(response), e.status_code
-            
-        except HTTPException as e:
-            # Handle Flask/Werkzeug HTTP exceptions
-            if logger:
-                logger.warning(
-                    f"HTTP error: {e.description}",
-                    extra={
-                        'status_code': e.code,
-                        'endpoint': request.endpoint,
-                        'correlation_id': correlation_id
-                    }
-                )
-            
-            response = {
-                'error': 'HTTP_ERROR',
-                'message': e.description,
-                'status_code': e.code
-            }
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-            return jsonify(response), e.code
-            
         except Exception as e:
-            # Catch-all for unexpected errors
-            if logger:
-                logger.critical(
-                    f"Unexpected error: {str(e)}",
-                    extra={
-                        'error_type': type(e).__name__,
-                        'endpoint': request.endpoint,
-                        'method': request.method,
-                        'correlation_id': correlation_id
-                    },
-                    exc_info=True
-                )
-            
-            # Don't expose internal error details in production
-            response = {
-                'error': 'INTERNAL_SERVER_ERROR',
-                'message': 'An unexpected error occurred',
-                'status_code': 500
-            }
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-            
-            return jsonify(response), 500
+            response = _error_handler_for(type(e))(e)
+            # The error is fully handled; release locals pinned by its frames
+            traceback.clear_frames(e.__traceback__)
+            return response
     
+    _fast_wraps(f, decorated_function)
+    decorated_function._handle_errors_wrapper = decorated_function
     return decorated_function
 
 
@@ -301,6 +431,26 @@ def handle_errors(f: Callable) -> Callable:
 # RETRY DECORATOR
 # ============================================================================
 
+# Set to abort pending retry waits (e.g. during shutdown)
+_retry_cancelled = threading.Event()
+
+
+def cancel_all_retries() -> None:
+    """
+    Abort every pending and future retry wait.
+    
+    Functions currently sleeping between attempts wake up immediately and
+    re-raise their last exception instead of retrying. Intended for graceful
+    shutdown; call resume_retries() to re-enable retrying.
+    """
+    _retry_cancelled.set()
+
+
+def resume_retries() -> None:
+    """Re-enable retrying after cancel_all_retries()"""
+    _retry_cancelled.clear()
+
+
 def retry_on_failure(
     max_retries: int = 3,
     backoff_factor: float = 2.0,
@@ -316,6 +466,8 @@ def retry_on_failure(
         exceptions: Tuple of exceptions to catch and retry (default: DataFetchError, ServiceUnavailableError)
         on_retry: Optional callback function called before each retry
     
+    Waits between attempts can be interrupted with cancel_all_retries().
+    
     Usage:
         @retry_on_failure(max_retries=3, backoff_factor=2)
         def fetch_data():
@@ -327,43 +479,42 @@ def retry_on_failure(
     - Attempt 2: wait 2^1 = 2 seconds
     - Attempt 3: wait 2^2 = 4 seconds
     """
+    # Wait before retry N is backoff_factor ** (N - 1); compute the whole
+    # schedule once instead of on every retry
+    wait_schedule = tuple(backoff_factor ** i for i in range(max_retries))
+    
     def decorator(f: Callable) -> Callable:
-        @functools.wraps(f)
         def wrapper(*args, **kwargs):
-            logger = None
-            try:
-                from common.logger import get_logger
-                logger = get_logger(__name__)
-            except ImportError:
-                pass
+            logger = _get_logger(__name__)
             
             last_exception = None
             
             for attempt in range(max_retries + 1):
-                try:
-                    # First attempt (attempt=0) happens immediately
-                    if attempt > 0:
-                        # Calculate wait time with exponential backoff
-                        wait_time = backoff_factor ** (attempt - 1)
-                        
-                        if logger:
-                            logger.warning(
-                                f"Retrying {f.__name__} after failure",
-                                extra={
-                                    'attempt': attempt,
-                                    'max_retries': max_retries,
-                                    'wait_seconds': wait_time,
-                                    'function': f.__name__
-                                }
-                            )
-                        
-                        # Call retry callback if provided
-                        if on_retry:
-                            on_retry(attempt, wait_time, last_exception)
-                        
-                        # Wait before retry
-                        time.sleep(wait_time)
+                # First attempt (attempt=0) happens immediately
+                if attempt > 0:
+                    # Look up wait time from the exponential backoff schedule
+                    wait_time = wait_schedule[attempt - 1]
                     
+                    if logger:
+                        logger.warning(
+                            f"Retrying {f.__name__} after failure",
+                            extra={
+                                'attempt': attempt,
+                                'max_retries': max_retries,
+                                'wait_seconds': wait_time,
+                                'function': f.__name__
+                            }
+                        )
+                    
+                    # Call retry callback if provided
+                    if on_retry:
+                        on_retry(attempt, wait_time, last_exception)
+                    
+                    # Wait before retry; give up early if retries were cancelled
+                    if _retry_cancelled.wait(wait_time):
+                        raise last_exception
+                
+                try:
                     # Execute the function
                     result = f(*args, **kwargs)
                     
@@ -396,14 +547,16 @@ def retry_on_failure(
                             )
                         raise
                     
-                    # Will retry on next iteration
+                    # Will retry on next iteration; last_exception outlives
+                    # this attempt, so drop the locals its frames pin
+                    traceback.clear_frames(e.__traceback__)
                     continue
             
             # Should never reach here, but just in case
             if last_exception:
                 raise last_exception
         
-        return wrapper
+        return _fast_wraps(f, wrapper)
     return decorator
 
 
@@ -425,77 +578,36 @@ def register_error_handlers(app):
     @app.errorhandler(APIError)
     def handle_api_error(error):
         """Handle all custom API errors"""
-        response = error.to_dict()
-        try:
-            from common.logger import get_correlation_id
-            correlation_id = get_correlation_id()
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-        except ImportError:
-            pass
-        return jsonify(response), error.status_code
+        return _error_body_response(_dumps(error._payload()), error.status_code,
+                                    _get_correlation_id())
     
     @app.errorhandler(404)
     def handle_not_found(error):
         """Handle 404 errors"""
-        response = {
-            'error': 'NOT_FOUND',
-            'message': 'The requested resource was not found',
-            'status_code': 404
-        }
-        try:
-            from common.logger import get_correlation_id
-            correlation_id = get_correlation_id()
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-        except ImportError:
-            pass
-        return jsonify(response), 404
+        correlation_id = _get_correlation_id()
+        return _error_body_response(_NOT_FOUND_BODY, 404, correlation_id)
     
     @app.errorhandler(405)
     def handle_method_not_allowed(error):
         """Handle 405 errors"""
-        response = {
-            'error': 'METHOD_NOT_ALLOWED',
-            'message': 'The method is not allowed for the requested URL',
-            'status_code': 405
-        }
-        try:
-            from common.logger import get_correlation_id
-            correlation_id = get_correlation_id()
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-        except ImportError:
-            pass
-        return jsonify(response), 405
+        correlation_id = _get_correlation_id()
+        return _error_body_response(_METHOD_NOT_ALLOWED_BODY, 405, correlation_id)
     
     @app.errorhandler(500)
     def handle_internal_error(error):
         """Handle 500 errors"""
-        try:
-            from common.logger import get_logger, get_correlation_id
-            logger = get_logger(__name__)
+        logger, correlation_id = _error_context()
+        if logger:
             logger.critical(
                 "Internal server error",
                 extra={'error': str(error)},
                 exc_info=True
             )
-        except ImportError:
-            pass
-        
-        response = {
-            'error': 'INTERNAL_SERVER_ERROR',
-            'message': 'An unexpected error occurred',
-            'status_code': 500
-        }
-        try:
-            from common.logger import get_correlation_id
-            correlation_id = get_correlation_id()
-            if correlation_id:
-                response['correlation_id'] = correlation_id
-        except ImportError:
-            pass
-        return jsonify(response), 500
+        return _error_body_response(_INTERNAL_ERROR_BODY, 500, correlation_id)
+
+
+# Sentinel distinguishing absent fields from fields explicitly set to None
+_MISSING = object()
 
 
 def validate_request_data(data: Dict[str, Any], required_fields: list, 
@@ -521,7 +633,18 @@ def validate_request_data(data: Dict[str, Any], required_fields: list,
     if not data:
         raise ValidationError("Request body is required")
     
-    missing_fields = [field for field in required_fields if field not in data]
+    if not isinstance(data, dict):
+        raise ValidationError("Request body must be a JSON object")
+    
+    # Classify every required field in a single pass
+    missing_fields = []
+    empty_fields = []
+    for field in required_fields:
+        value = data.get(field, _MISSING)
+        if value is _MISSING:
+            missing_fields.append(field)
+        elif value is None or value == '':
+            empty_fields.append(field)
     
     if missing_fields:
         raise ValidationError(
@@ -529,12 +652,6 @@ def validate_request_data(data: Dict[str, Any], required_fields: list,
             details={'missing_fields': missing_fields}
         )
     
-    # Check for empty values
-    empty_fields = [
-        field for field in required_fields 
-        if field in data and (data[field] is None or data[field] == '')
-    ]
-    
     if empty_fields:
         raise ValidationError(
             f"Fields cannot be empty: {', '.join(empty_fields)}",
@@ -9,17 +9,51 @@ This module provides comprehensive health checking functionality including:
 - System metrics collection (CPU, memory, uptime)
 """
 
+import atexit
 import os
 import psutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
 from sqlalchemy import create_engine, text
 from .logger import get_logger
 
+try:
+    import redis
+except ImportError:
+    redis = None
+
 logger = get_logger(__name__)
 
+# Lightweight Yahoo Finance probe: a one-day chart for a single symbol is a
+# few hundred bytes, versus the full quote summary behind yfinance's .info.
+# HEALTH_CHECK_API_URL points the probe elsewhere (e.g. an internal proxy);
+# '{symbol}' in the URL is replaced with the test symbol.
+YAHOO_PROBE_URL = os.getenv(
+    'HEALTH_CHECK_API_URL',
+    'https://query1.finance.yahoo.com/v8/finance/chart/{symbol}'
+)
+
+# Shared keep-alive session for external API probes
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+_http_session.headers['User-Agent'] = 'Mozilla/5.0 (compatible; AQUA-HealthCheck/1.0)'
+
+
+@dataclass(slots=True)
+class SystemSnapshot:
+    """Host and process readings taken in one psutil pass per health probe."""
+    disk: Any
+    memory: Any
+    cpu_percent: float
+    process_cpu_percent: float
+    process_memory: Any
+
 
 class HealthCheck:
     """
@@ -32,7 +66,9 @@ class HealthCheck:
     def __init__(self, 
                  db_url: Optional[str] = None,
                  redis_url: Optional[str] = None,
-                 service_name: str = "unknown"):
+                 service_name: str = "unknown",
+                 check_timeout: float = 5.0,
+                 cache_ttl_seconds: float = 0.5):
         """
         Initialize health checker.
         
@@ -40,18 +76,100 @@ class HealthCheck:
             db_url: Database connection URL (SQLAlchemy format)
             redis_url: Redis connection URL
             service_name: Name of the service being monitored
+            check_timeout: Seconds run_all_checks waits for checks before
+                reporting the stragglers as timed out
+            cache_ttl_seconds: How long a run_all_checks result is reused,
+                so bursts of probes collapse into one real check (0 disables)
         """
         self.db_url = db_url or os.getenv('DATABASE_URL')
         self.redis_url = redis_url
         self.service_name = service_name
+        self.check_timeout = check_timeout
+        self.cache_ttl_seconds = cache_ttl_seconds
         self.start_time = time.time()
         
+        # This process and the CPU count don't change; look them up once
+        self._process = psutil.Process(os.getpid())
+        self._cpu_count = psutil.cpu_count()
+        
+        # Prime CPU sampling: with interval=None psutil reports usage since
+        # the previous call, so probes never have to sleep to measure it
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+        
+        # The dependency checks are independent and IO-bound; run_all_checks
+        # fans them out over a small persistent pool (one worker per check)
+        self._executor = ThreadPoolExecutor(
+            max_workers=3,
+            thread_name_prefix=f'health-{service_name}'
+        )
+        
+        # Database engine and Redis client are created on first check and
+        # reused afterwards
+        self._engine = None
+        self._redis = None
+        self._client_lock = threading.Lock()
+        
+        # Recent run_all_checks results keyed by the enabled checks:
+        # {flags: (expires_at_monotonic, result)}
+        self._result_cache = {}
+        self._result_lock = threading.Lock()
+        atexit.register(self.close)
+        
         logger.debug("HealthCheck initialized", extra={
             'service': service_name,
             'has_db': bool(self.db_url),
             'has_redis': bool(self.redis_url)
         })
     
+    def close(self) -> None:
+        """Release pooled database/Redis connections and worker threads."""
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+        if self._redis is not None:
+            self._redis.connection_pool.disconnect()
+            self._redis = None
+        self._executor.shutdown(wait=False)
+    
+    def _get_engine(self):
+        """
+        Get the shared database engine, creating it on first use.
+        
+        Reusing one small pool turns each probe into a checkout + SELECT 1
+        instead of a full connect/handshake/teardown.
+        """
+        if self._engine is None:
+            with self._client_lock:
+                if self._engine is None:
+                    self._engine = create_engine(
+                        self.db_url,
+                        pool_size=2,
+                        max_overflow=2,
+                        pool_pre_ping=True,
+                        pool_recycle=300,
+                        connect_args={
+                            'connect_timeout': 5,
+                            'options': '-c statement_timeout=2000'
+                        }
+                    )
+        return self._engine
+    
+    def _get_redis(self):
+        """Get the shared Redis client, creating its connection pool on first use."""
+        if self._redis is None:
+            with self._client_lock:
+                if self._redis is None:
+                    pool = redis.ConnectionPool.from_url(
+                        self.redis_url,
+                        max_connections=8,
+                        socket_connect_timeout=5,
+                        socket_timeout=2,
+                        health_check_interval=30
+                    )
+                    self._redis = redis.Redis(connection_pool=pool)
+        return self._redis
+    
     def check_database(self) -> Dict[str, Any]:
         """
         Test PostgreSQL database connection.
@@ -72,17 +190,9 @@ class HealthCheck:
         start_time = time.time()
         
         try:
-            # Create engine with short timeout
-            engine = create_engine(
-                self.db_url,
-                pool_pre_ping=True,
-                connect_args={'connect_timeout': 5}
-            )
-            
             # Test connection with simple query
-            with engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
-                result.fetchone()
+            with self._get_engine().connect() as conn:
+                conn.execute(text("SELECT 1")).scalar()
             
             response_time = (time.time() - start_time) * 1000  # Convert to ms
             
@@ -90,8 +200,6 @@ class HealthCheck:
                 'response_time_ms': response_time
             })
             
-            engine.dispose()
-            
             return {
                 'status': 'healthy',
                 'healthy': True,
@@ -131,16 +239,18 @@ class HealthCheck:
                 'healthy': True  # Not required for current implementation
             }
         
+        if redis is None:
+            return {
+                'status': 'skipped',
+                'message': 'Redis library not installed',
+                'healthy': True
+            }
+        
         start_time = time.time()
         
         try:
-            import redis
-            
-            # Parse Redis URL
-            r = redis.from_url(self.redis_url, socket_connect_timeout=5)
-            
             # Test connection
-            r.ping()
+            self._get_redis().ping()
             
             response_time = (time.time() - start_time) * 1000
             
@@ -155,12 +265,6 @@ class HealthCheck:
                 'message': 'Redis connection successful'
             }
             
-        except ImportError:
-            return {
-                'status': 'skipped',
-                'message': 'Redis library not installed',
-                'healthy': True
-            }
         except Exception as e:
             response_time = (time.time() - start_time) * 1000
             
@@ -179,10 +283,10 @@ class HealthCheck:
     
     def check_external_api(self, test_symbol: str = "AAPL") -> Dict[str, Any]:
         """
-        Test yfinance API availability.
+        Test Yahoo Finance API availability.
         
-        Attempts to fetch a small amount of data from Yahoo Finance
-        to verify the external API is accessible.
+        Requests a one-day chart for a single symbol over a pooled
+        keep-alive session to verify the external API is accessible.
         
         Args:
             test_symbol: Stock symbol to test with
@@ -193,15 +297,15 @@ class HealthCheck:
         start_time = time.time()
         
         try:
-            import yfinance as yf
-            
-            # Quick test fetch with minimal data
-            ticker = yf.Ticker(test_symbol)
-            info = ticker.info
+            response = _http_session.get(
+                YAHOO_PROBE_URL.format(symbol=test_symbol),
+                params={'range': '1d', 'interval': '1d'},
+                timeout=(2, 3)
+            )
             
-            # Verify we got some data back
-            if not info or 'symbol' not in info:
-                raise ValueError("No data returned from yfinance")
+            # Verify the API answered successfully
+            if response.status_code != 200:
+                raise ValueError(f"Yahoo Finance returned HTTP {response.status_code}")
             
             response_time = (time.time() - start_time) * 1000
             
@@ -218,12 +322,6 @@ class HealthCheck:
                 'api': 'yfinance'
             }
             
-        except ImportError:
-            return {
-                'status': 'skipped',
-                'message': 'yfinance library not installed',
-                'healthy': True
-            }
         except Exception as e:
             response_time = (time.time() - start_time) * 1000
             
@@ -242,7 +340,19 @@ class HealthCheck:
                 'api': 'yfinance'
             }
     
-    def check_disk_space(self, min_free_gb: float = 1.0) -> Dict[str, Any]:
+    def _snapshot_system(self) -> SystemSnapshot:
+        """Read disk, memory and CPU stats for the host and this process."""
+        process = self._process
+        return SystemSnapshot(
+            disk=psutil.disk_usage('/'),
+            memory=psutil.virtual_memory(),
+            cpu_percent=psutil.cpu_percent(interval=None),
+            process_cpu_percent=process.cpu_percent(interval=None),
+            process_memory=process.memory_info()
+        )
+    
+    def check_disk_space(self, min_free_gb: float = 1.0,
+                         snapshot: Optional[SystemSnapshot] = None) -> Dict[str, Any]:
         """
         Check available disk space.
         
@@ -250,13 +360,15 @@ class HealthCheck:
         
         Args:
             min_free_gb: Minimum free space in GB required
+            snapshot: Readings already taken for this probe (reads disk
+                usage directly if omitted)
             
         Returns:
             Dictionary with status, disk usage stats, and health status
         """
         try:
             # Get disk usage for root partition
-            disk = psutil.disk_usage('/')
+            disk = snapshot.disk if snapshot else psutil.disk_usage('/')
             
             free_gb = disk.free / (1024 ** 3)  # Convert bytes to GB
             total_gb = disk.total / (1024 ** 3)
@@ -297,30 +409,36 @@ class HealthCheck:
                 'message': 'Failed to check disk space'
             }
     
-    def get_system_metrics(self) -> Dict[str, Any]:
+    def get_system_metrics(self, snapshot: Optional[SystemSnapshot] = None) -> Dict[str, Any]:
         """
         Collect system performance metrics.
         
         Gathers information about CPU usage, memory usage, and service uptime.
         
+        Args:
+            snapshot: Readings already taken for this probe (taken here if
+                omitted)
+        
         Returns:
             Dictionary with CPU, memory, and uptime metrics
         """
         try:
+            if snapshot is None:
+                snapshot = self._snapshot_system()
+            
             # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            cpu_count = psutil.cpu_count()
+            cpu_percent = snapshot.cpu_percent
+            cpu_count = self._cpu_count
             
             # Memory metrics
-            memory = psutil.virtual_memory()
+            memory = snapshot.memory
             memory_total_mb = memory.total / (1024 ** 2)
             memory_used_mb = memory.used / (1024 ** 2)
             memory_percent = memory.percent
             
             # Process-specific metrics
-            process = psutil.Process(os.getpid())
-            process_memory_mb = process.memory_info().rss / (1024 ** 2)
-            process_cpu_percent = process.cpu_percent(interval=0.1)
+            process_memory_mb = snapshot.process_memory.rss / (1024 ** 2)
+            process_cpu_percent = snapshot.process_cpu_percent
             
             # Uptime
             uptime_seconds = time.time() - self.start_time
@@ -368,18 +486,13 @@ class HealthCheck:
         Returns:
             Formatted string like "2h 15m 30s"
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        
-        parts = []
-        if hours > 0:
-            parts.append(f"{hours}h")
-        if minutes > 0:
-            parts.append(f"{minutes}m")
-        parts.append(f"{secs}s")
-        
-        return " ".join(parts)
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        
+        # Zero hours/minutes are omitted, e.g. "2h 30s"
+        if hours:
+            return f"{hours}h {minutes}m {secs}s" if minutes else f"{hours}h {secs}s"
+        return f"{minutes}m {secs}s" if minutes else f"{secs}s"
     
     def run_all_checks(self, 
                        check_db: bool = True,
@@ -389,6 +502,10 @@ class HealthCheck:
         """
         Run all configured health checks.
         
+        Results are reused for cache_ttl_seconds, so concurrent or rapid
+        probes (load balancers, orchestrator liveness checks) share a
+        single round of dependency checks.
+        
         Args:
             check_db: Whether to check database
             check_redis: Whether to check Redis
@@ -398,6 +515,35 @@ class HealthCheck:
         Returns:
             Dictionary with all check results and overall health status
         """
+        flags = (check_db, check_redis, check_api, check_disk)
+        
+        cached = self._cached_result(flags)
+        if cached is None:
+            with self._result_lock:
+                # Another probe may have refreshed the result while we waited
+                cached = self._cached_result(flags)
+                if cached is None:
+                    cached = self._run_checks(*flags)
+                    self._result_cache[flags] = (
+                        time.monotonic() + self.cache_ttl_seconds, cached
+                    )
+        
+        # Callers may add their own checks; keep the cached entry intact
+        return {**cached, 'checks': dict(cached['checks'])}
+    
+    def _cached_result(self, flags: tuple) -> Optional[Dict[str, Any]]:
+        """Return the cached result for these flags if it hasn't expired."""
+        entry = self._result_cache.get(flags)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def _run_checks(self,
+                    check_db: bool,
+                    check_redis: bool,
+                    check_api: bool,
+                    check_disk: bool) -> Dict[str, Any]:
+        """Run the enabled checks concurrently and build the health result."""
         logger.info("Running health checks", extra={
             'service': self.service_name,
             'check_db': check_db,
@@ -406,19 +552,55 @@ class HealthCheck:
             'check_disk': check_disk
         })
         
-        checks = {}
+        tasks = {}
         
         if check_db:
-            checks['database'] = self.check_database()
+            tasks['database'] = self.check_database
         
         if check_redis:
-            checks['redis'] = self.check_redis()
+            tasks['redis'] = self.check_redis
         
         if check_api:
-            checks['external_api'] = self.check_external_api()
+            tasks['external_api'] = self.check_external_api
+        
+        # Run checks concurrently so latency is the slowest check rather
+        # than the sum. All checks share one deadline so a stalled
+        # dependency can't pin the request beyond check_timeout.
+        deadline = time.monotonic() + self.check_timeout
+        futures = {
+            name: self._executor.submit(check)
+            for name, check in tasks.items()
+        }
+        
+        # Disk space and system metrics come from a single set of psutil
+        # reads, taken here while the IO checks are in flight
+        try:
+            snapshot = self._snapshot_system()
+        except Exception as e:
+            logger.error("Failed to snapshot system stats", extra={'error': str(e)})
+            snapshot = None
+        
+        disk_result = self.check_disk_space(snapshot=snapshot) if check_disk else None
+        metrics = self.get_system_metrics(snapshot)
+        
+        checks = {}
+        for name, future in futures.items():
+            try:
+                checks[name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                logger.error("Health check timed out", extra={
+                    'check': name,
+                    'timeout_seconds': self.check_timeout
+                })
+                checks[name] = {
+                    'status': 'unhealthy',
+                    'healthy': False,
+                    'error': 'timeout',
+                    'message': f'Check did not complete within {self.check_timeout}s'
+                }
         
-        if check_disk:
-            checks['disk_space'] = self.check_disk_space()
+        if disk_result is not None:
+            checks['disk_space'] = disk_result
         
         # Determine overall health
         all_healthy = all(
@@ -433,7 +615,7 @@ class HealthCheck:
             'service': self.service_name,
             'timestamp': datetime.now().isoformat(),
             'checks': checks,
-            'metrics': self.get_system_metrics()
+            'metrics': metrics
         }
         
         logger.info("Health checks completed", extra={
@@ -4,17 +4,53 @@ Provides JSON and pretty-formatted logging with rotation
 """
 import logging
 import logging.handlers
+import atexit
+import copy
 import json
 import os
+import queue
+import re
 import sys
+import threading
 import uuid
-from datetime import datetime
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
-from functools import wraps
-import threading
+from functools import lru_cache, wraps
+import time
+
+try:
+    import orjson
+    
+    _ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    _orjson_dumps = orjson.dumps
+    
+    def _dumps(obj: Dict[str, Any]) -> str:
+        """Serialize a log record dict; orjson formats datetimes natively"""
+        return _orjson_dumps(obj, default=str, option=_ORJSON_OPTS).decode()
+except ImportError:  # pragma: no cover - orjson is in requirements
+    def _dumps(obj: Dict[str, Any]) -> str:
+        """Serialize a log record dict with the stdlib encoder"""
+        timestamp = obj.get('timestamp')
+        if isinstance(timestamp, datetime):
+            obj['timestamp'] = timestamp.isoformat() + 'Z'
+        return json.dumps(obj, default=str)
+
+# Correlation ID for the current request; ContextVar keeps it per thread
+# and per asyncio task
+_correlation_id: ContextVar[Optional[str]] = ContextVar('correlation_id', default=None)
+
+
+def _record_correlation_id(record: logging.LogRecord) -> Optional[str]:
+    """Correlation ID captured when the record was queued, else the current one"""
+    return getattr(record, 'correlation_id', None) or _correlation_id.get()
+
 
-# Thread-local storage for correlation IDs
-_thread_local = threading.local()
+def _record_exception(formatter: logging.Formatter, record: logging.LogRecord) -> Optional[str]:
+    """Formatted traceback, including one rendered before the record was queued"""
+    if record.exc_info:
+        return formatter.formatException(record.exc_info)
+    return record.exc_text or None
 
 
 class JSONFormatter(logging.Formatter):
@@ -23,35 +59,64 @@ class JSONFormatter(logging.Formatter):
     Outputs logs in JSON format for production environments
     """
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # Millisecond timestamps from a per-second cache by default;
+        # LOG_EXACT_TIMESTAMPS=true keeps full microsecond datetimes
+        self._exact_timestamps = os.getenv('LOG_EXACT_TIMESTAMPS', 'false').lower() == 'true'
+        self._last_second = (None, '')
+    
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record time as 'YYYY-mm-ddTHH:MM:SS.mmmZ' (UTC)"""
+        second, ms = divmod(int(created * 1000), 1000)
+        cached_second, prefix = self._last_second
+        if second != cached_second:
+            t = time.gmtime(second)
+            prefix = (
+                f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T"
+                f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            )
+            self._last_second = (second, prefix)
+        return f"{prefix}.{ms:03d}Z"
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
+        if self._exact_timestamps:
+            timestamp = datetime.fromtimestamp(record.created, timezone.utc).replace(tzinfo=None)
+        else:
+            timestamp = self._format_timestamp(record.created)
+        
         log_data = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': timestamp,
             'level': record.levelname,
             'service': record.name,
             'message': record.getMessage(),
-            'correlation_id': getattr(_thread_local, 'correlation_id', None),
         }
         
+        # Optional fields are inserted only when set, so no None-filter pass
+        correlation_id = _record_correlation_id(record)
+        if correlation_id is not None:
+            log_data['correlation_id'] = correlation_id
+        
         # Add extra fields if present
-        if hasattr(record, 'extra_fields'):
-            log_data.update(record.extra_fields)
+        extra_fields = getattr(record, 'extra_fields', None)
+        if extra_fields:
+            for key, value in extra_fields.items():
+                if value is not None:
+                    log_data[key] = value
         
         # Add exception info if present
-        if record.exc_info:
-            log_data['exception'] = self.formatException(record.exc_info)
+        exception = _record_exception(self, record)
+        if exception:
+            log_data['exception'] = exception
         
         # Add additional record attributes
-        log_data.update({
-            'file': record.filename,
-            'function': record.funcName,
-            'line': record.lineno,
-        })
-        
-        # Remove None values
-        log_data = {k: v for k, v in log_data.items() if v is not None}
+        log_data['file'] = record.filename
+        log_data['function'] = record.funcName
+        log_data['line'] = record.lineno
         
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 class PrettyFormatter(logging.Formatter):
@@ -70,19 +135,51 @@ class PrettyFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        reset = self.COLORS['RESET']
+        
+        # Colored, padded level names and padded service names per record
+        # are the same strings every time; build them once
+        self._level_prefix = {
+            level: f"{color}{level:8}{reset}"
+            for level, color in self.COLORS.items()
+        }
+        self._service_names: Dict[str, str] = {}
+        
+        # Local time down to the second, reused while records share a second
+        self._last_second = (None, '')
+    
+    def _format_timestamp(self, created: float, msecs: float) -> str:
+        """Format a record time as 'YYYY-mm-dd HH:MM:SS.mmm' without strftime"""
+        second = int(created)
+        cached_second, prefix = self._last_second
+        if second != cached_second:
+            lt = time.localtime(second)
+            prefix = (
+                f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} "
+                f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+            )
+            self._last_second = (second, prefix)
+        return f"{prefix}.{int(msecs):03d}"
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors and pretty layout"""
-        color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        reset = self.COLORS['RESET']
+        level = self._level_prefix.get(record.levelname)
+        if level is None:
+            reset = self.COLORS['RESET']
+            level = f"{reset}{record.levelname:8}{reset}"
+        
+        service = self._service_names.get(record.name)
+        if service is None:
+            service = self._service_names[record.name] = f"{record.name:30}"
         
         # Build the log message
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        level = f"{color}{record.levelname:8}{reset}"
-        service = f"{record.name:30}"
+        timestamp = self._format_timestamp(record.created, record.msecs)
         message = record.getMessage()
         
         # Add correlation ID if present
-        correlation_id = getattr(_thread_local, 'correlation_id', None)
+        correlation_id = _record_correlation_id(record)
         correlation_str = f" [{correlation_id[:8]}]" if correlation_id else ""
         
         log_line = f"{timestamp} | {level} | {service}{correlation_str} | {message}"
@@ -93,8 +190,9 @@ class PrettyFormatter(logging.Formatter):
             log_line += f" | {extras}"
         
         # Add exception info if present
-        if record.exc_info:
-            log_line += f"\n{self.formatException(record.exc_info)}"
+        exception = _record_exception(self, record)
+        if exception:
+            log_line += f"\n{exception}"
         
         return log_line
 
@@ -105,34 +203,123 @@ class StructuredLogger(logging.Logger):
     """
     
     def _log_with_extras(self, level, msg, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
-        """Internal method to log with extra fields"""
+        """
+        Internal method to log with extra fields
+        
+        Callers check isEnabledFor first, so disabled levels never build
+        the record kwargs.
+        """
         if extra:
             # Create a custom LogRecord with extra fields
-            if 'extra' not in kwargs:
-                kwargs['extra'] = {}
-            kwargs['extra']['extra_fields'] = extra
+            kwargs['extra'] = {'extra_fields': extra}
         
         super()._log(level, msg, args, **kwargs)
     
     def debug(self, msg, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
         """Log debug message with optional extra fields"""
-        self._log_with_extras(logging.DEBUG, msg, *args, extra=extra, **kwargs)
+        if self.isEnabledFor(logging.DEBUG):
+            self._log_with_extras(logging.DEBUG, msg, *args, extra=extra, **kwargs)
     
     def info(self, msg, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
         """Log info message with optional extra fields"""
-        self._log_with_extras(logging.INFO, msg, *args, extra=extra, **kwargs)
+        if self.isEnabledFor(logging.INFO):
+            self._log_with_extras(logging.INFO, msg, *args, extra=extra, **kwargs)
     
     def warning(self, msg, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
         """Log warning message with optional extra fields"""
-        self._log_with_extras(logging.WARNING, msg, *args, extra=extra, **kwargs)
+        if self.isEnabledFor(logging.WARNING):
+            self._log_with_extras(logging.WARNING, msg, *args, extra=extra, **kwargs)
     
     def error(self, msg, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
         """Log error message with optional extra fields"""
-        self._log_with_extras(logging.ERROR, msg, *args, extra=extra, **kwargs)
+        if self.isEnabledFor(logging.ERROR):
+            self._log_with_extras(logging.ERROR, msg, *args, extra=extra, **kwargs)
     
     def critical(self, msg, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
         """Log critical message with optional extra fields"""
-        self._log_with_extras(logging.CRITICAL, msg, *args, extra=extra, **kwargs)
+        if self.isEnabledFor(logging.CRITICAL):
+            self._log_with_extras(logging.CRITICAL, msg, *args, extra=extra, **kwargs)
+    
+    def log(self, level, msg, *args, extra: Optional[Dict[str, Any]] = None, **kwargs):
+        """Log message at an arbitrary level with optional extra fields"""
+        if self.isEnabledFor(level):
+            self._log_with_extras(level, msg, *args, extra=extra, **kwargs)
+
+
+# Loggers created after import (including via get_logger) are StructuredLoggers
+logging.setLoggerClass(StructuredLogger)
+
+
+# ============================================================================
+# Background log I/O
+# ============================================================================
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the background listener instead of writing them.
+    
+    The record is resolved on the caller's thread (message, correlation
+    ID, traceback) since those depend on request context; the target
+    handlers then format and write it on the listener thread.
+    """
+    
+    def __init__(self, log_queue, handlers):
+        super().__init__(log_queue)
+        self.target_handlers = tuple(handlers)
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.correlation_id = _correlation_id.get()
+        record.target_handlers = self.target_handlers
+        if record.exc_info:
+            record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def flush(self):
+        """Block until records queued so far have been written"""
+        _listener.flush()
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """Single listener thread that routes each record to its logger's handlers"""
+    
+    def handle(self, record):
+        if isinstance(record, threading.Event):
+            # flush() marker: everything queued before it has been handled
+            record.set()
+            return
+        for handler in record.target_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+    
+    def start(self):
+        with _listener_lock:
+            if self._thread is None:
+                super().start()
+    
+    def stop(self):
+        with _listener_lock:
+            if self._thread is not None:
+                super().stop()
+    
+    def flush(self, timeout: float = 5.0):
+        """Wait for the listener to drain the records queued so far"""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        marker = threading.Event()
+        self.queue.put_nowait(marker)
+        marker.wait(timeout)
+
+
+_exc_formatter = logging.Formatter()
+_log_queue = queue.SimpleQueue()
+_listener_lock = threading.Lock()
+_listener = _QueueListener(_log_queue)
+atexit.register(_listener.stop)
 
 
 def get_logger(name: str, service_name: Optional[str] = None) -> StructuredLogger:
@@ -150,11 +337,18 @@ def get_logger(name: str, service_name: Optional[str] = None) -> StructuredLogge
         logger = get_logger(__name__)
         logger.info("Processing request", extra={"user_id": 123, "action": "login"})
     """
-    # Set the custom logger class
-    logging.setLoggerClass(StructuredLogger)
+    return _configure_logger(service_name or os.getenv('LOG_SERVICE_NAME', name))
+
+
+@lru_cache(maxsize=256)
+def _configure_logger(logger_name: str) -> StructuredLogger:
+    """
+    Create and configure the named logger once; later calls hit the cache
     
-    # Get or create logger
-    logger = logging.getLogger(service_name or os.getenv('LOG_SERVICE_NAME', name))
+    Environment settings are read here, when a logger is first configured,
+    so repeated get_logger calls skip them entirely.
+    """
+    logger = logging.getLogger(logger_name)
     
     # Prevent duplicate handlers
     if logger.handlers:
@@ -178,7 +372,7 @@ def get_logger(name: str, service_name: Optional[str] = None) -> StructuredLogge
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logger.level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler with rotation if log file is specified
     if log_file:
@@ -192,20 +386,25 @@ def get_logger(name: str, service_name: Optional[str] = None) -> StructuredLogge
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True
         )
         file_handler.setLevel(logger.level)
         
         # Always use JSON format for file logs
         file_handler.setFormatter(JSONFormatter())
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Writes happen on the listener thread; logging calls only enqueue
+    logger.addHandler(_QueueHandler(_log_queue, handlers))
+    _listener.start()
     
     return logger
 
 
 def set_correlation_id(correlation_id: Optional[str] = None) -> str:
     """
-    Set correlation ID for the current thread/request
+    Set correlation ID for the current request context
     
     Args:
         correlation_id: Custom correlation ID (generates UUID if None)
@@ -220,24 +419,23 @@ def set_correlation_id(correlation_id: Optional[str] = None) -> str:
     if correlation_id is None:
         correlation_id = str(uuid.uuid4())
     
-    _thread_local.correlation_id = correlation_id
+    _correlation_id.set(correlation_id)
     return correlation_id
 
 
 def get_correlation_id() -> Optional[str]:
     """
-    Get the current correlation ID for this thread/request
+    Get the current correlation ID for this request context
     
     Returns:
         Current correlation ID or None
     """
-    return getattr(_thread_local, 'correlation_id', None)
+    return _correlation_id.get()
 
 
 def clear_correlation_id():
-    """Clear the correlation ID for the current thread/request"""
-    if hasattr(_thread_local, 'correlation_id'):
-        delattr(_thread_local, 'correlation_id')
+    """Clear the correlation ID for the current request context"""
+    _correlation_id.set(None)
 
 
 def log_execution_time(logger: Optional[StructuredLogger] = None):
@@ -260,12 +458,11 @@ def log_execution_time(logger: Optional[StructuredLogger] = None):
         
         @wraps(func)
         def wrapper(*args, **kwargs):
-            import time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             try:
                 result = func(*args, **kwargs)
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
                 logger.info(
                     f"Function {func.__name__} completed",
@@ -279,7 +476,7 @@ def log_execution_time(logger: Optional[StructuredLogger] = None):
                 return result
             
             except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
                 logger.error(
                     f"Function {func.__name__} failed",
@@ -297,6 +494,18 @@ def log_execution_time(logger: Optional[StructuredLogger] = None):
     return decorator
 
 
+# Keys containing any of these (case-insensitive) are masked by default
+_DEFAULT_SENSITIVE_RE = re.compile(
+    r'password|token|secret|api[_-]?key|authorization', re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=32)
+def _sensitive_key_pattern(sensitive_keys: tuple) -> re.Pattern:
+    """Compile (once per key set) a case-insensitive substring matcher"""
+    return re.compile('|'.join(map(re.escape, sensitive_keys)), re.IGNORECASE)
+
+
 def mask_sensitive_data(data: Dict[str, Any], sensitive_keys: list = None) -> Dict[str, Any]:
     """
     Mask sensitive data in dictionaries before logging
@@ -313,15 +522,17 @@ def mask_sensitive_data(data: Dict[str, Any], sensitive_keys: list = None) -> Di
         logger.info("User data", extra=safe_data)
     """
     if sensitive_keys is None:
-        sensitive_keys = ['password', 'token', 'secret', 'api_key', 'authorization']
-    
-    masked_data = data.copy()
-    
-    for key in masked_data:
-        if any(sensitive in key.lower() for sensitive in sensitive_keys):
-            masked_data[key] = '***MASKED***'
+        pattern = _DEFAULT_SENSITIVE_RE
+    elif not sensitive_keys:
+        return data.copy()
+    else:
+        pattern = _sensitive_key_pattern(tuple(sensitive_keys))
     
-    return masked_data
+    search = pattern.search
+    return {
+        key: '***MASKED***' if search(key) else value
+        for key, value in data.items()
+    }
 
 
 # Example usage for testing
@@ -8,14 +8,37 @@ Provides standardized metrics collection across all services:
 - Strategy-specific metrics
 """
 
-from prometheus_client import Counter, Histogram, Gauge, Info
-from functools import wraps
+from prometheus_client import (
+    Counter, Histogram, Gauge, Info,
+    REGISTRY, PROCESS_COLLECTOR, GC_COLLECTOR, PLATFORM_COLLECTOR
+)
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+import itertools
+import logging
+import os
+import re
+import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# ============================================================================
+# DEFAULT COLLECTORS
+# ============================================================================
+# prometheus_client's process, GC and platform collectors read /proc and GC
+# stats on every scrape. Nothing here consumes them (host metrics come from
+# HealthCheck), so they are dropped unless METRICS_PROCESS_COLLECTORS is set.
+
+if os.getenv('METRICS_PROCESS_COLLECTORS', 'false').lower() != 'true':
+    for _collector in (PROCESS_COLLECTOR, GC_COLLECTOR, PLATFORM_COLLECTOR):
+        try:
+            REGISTRY.unregister(_collector)
+        except KeyError:
+            pass  # Already unregistered
+
 # ============================================================================
 # REQUEST METRICS
 # ============================================================================
@@ -30,7 +53,7 @@ request_duration_seconds = Histogram(
     'request_duration_seconds',
     'HTTP request duration in seconds',
     ['service', 'endpoint', 'method'],
-    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
 )
 
 request_size_bytes = Histogram(
@@ -68,7 +91,7 @@ backtest_return_percent = Histogram(
     'backtest_return_percent',
     'Backtest return percentage',
     ['strategy', 'ticker'],
-    buckets=[-50, -20, -10, -5, 0, 5, 10, 20, 50, 100, 200]
+    buckets=(-50, -10, 0, 10, 50, 100)
 )
 
 backtest_sharpe_ratio = Gauge(
@@ -209,11 +232,134 @@ health_check_status = Gauge(
     ['service', 'check_type']
 )
 
+# ============================================================================
+# LABEL CARDINALITY
+# ============================================================================
+# Every label value is a separate series (and, for histograms, one series per
+# bucket). Tickers come from user input, so only the first
+# METRICS_MAX_TICKERS distinct symbols get their own series; the rest are
+# recorded under 'other'.
+
+MAX_TICKER_LABELS = int(os.getenv('METRICS_MAX_TICKERS', '100'))
+
+_ticker_labels = set()
+_ticker_labels_lock = threading.Lock()
+
+
+def ticker_label(ticker: str) -> str:
+    """
+    Label value to record for a ticker.
+    
+    Args:
+        ticker: Ticker symbol
+        
+    Returns:
+        The ticker itself, or 'other' once the ticker cap has been reached
+    """
+    if ticker in _ticker_labels:
+        return ticker
+    with _ticker_labels_lock:
+        if len(_ticker_labels) < MAX_TICKER_LABELS:
+            _ticker_labels.add(ticker)
+            return ticker
+    return 'other'
+
+
+# ============================================================================
+# LABEL CHILD CACHES
+# ============================================================================
+# .labels(...) hashes the label values and looks the child up under a lock on
+# every call. Label combinations are bounded, so the hot paths below bind
+# each child once and reuse it.
+
+@lru_cache(maxsize=4096)
+def _request_counter(service: str, endpoint: str, method: str, status: str):
+    return api_requests_total.labels(service, endpoint, method, status)
+
+
+@lru_cache(maxsize=4096)
+def _request_duration(service: str, endpoint: str, method: str):
+    return request_duration_seconds.labels(service, endpoint, method)
+
+
+@dataclass(slots=True)
+class MetricBundle:
+    """Request metric children for one (service, endpoint, method, status)"""
+    requests: Counter
+    duration: Histogram
+    # Call counter for sampling; next() on itertools.count is atomic under the GIL
+    calls: itertools.count = field(default_factory=lambda: itertools.count(1))
+
+
+@lru_cache(maxsize=4096)
+def _request_bundle(service: str, endpoint: str, method: str, status: str) -> MetricBundle:
+    return MetricBundle(
+        _request_counter(service, endpoint, method, status),
+        _request_duration(service, endpoint, method)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _db_operation_counter(service: str, operation: str, status: str):
+    return db_operations_total.labels(service, operation, status)
+
+
+@lru_cache(maxsize=1024)
+def _db_operation_duration(service: str, operation: str):
+    return db_operation_duration_seconds.labels(service, operation)
+
+
+@lru_cache(maxsize=1024)
+def _error_counter(service: str, error_type: str, endpoint: str):
+    return errors_total.labels(service, error_type, endpoint)
+
+
+@lru_cache(maxsize=1024)
+def _strategy_duration(strategy: str, ticker: str):
+    return strategy_execution_duration.labels(strategy, ticker)
+
+
+@lru_cache(maxsize=1024)
+def _backtest_metrics(strategy: str, ticker: str):
+    """(trades counter, return histogram, Sharpe gauge) for one strategy/ticker"""
+    return (
+        backtest_trades_total.labels(strategy, ticker),
+        backtest_return_percent.labels(strategy, ticker),
+        backtest_sharpe_ratio.labels(strategy, ticker)
+    )
+
+
+@lru_cache(maxsize=256)
+def _health_check_metrics(service: str, check_type: str):
+    """(duration histogram, status gauge) for one service/check type"""
+    return (
+        health_check_duration_seconds.labels(service, check_type),
+        health_check_status.labels(service, check_type)
+    )
+
+
+# Path segments that are record IDs rather than part of the route
+_ID_SEGMENT_RE = re.compile(r'\d+|[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}')
+
+
+def _normalize_endpoint(endpoint: str) -> str:
+    """
+    Collapse ID-like path segments so the endpoint label is a route template.
+    
+    Each distinct label value is a separate time series, so '/orders/123'
+    and '/orders/124' must both be recorded as '/orders/<id>'.
+    """
+    return '/'.join(
+        '<id>' if _ID_SEGMENT_RE.fullmatch(segment) else segment
+        for segment in endpoint.split('/')
+    )
+
+
 # ============================================================================
 # DECORATOR FUNCTIONS
 # ============================================================================
 
-def track_request_metrics(service_name: str, endpoint: str):
+def track_request_metrics(service_name: str, endpoint: str, sample_rate: int = 1):
     """
     Decorator to automatically track request metrics.
     
@@ -225,59 +371,70 @@ def track_request_metrics(service_name: str, endpoint: str):
     
     Args:
         service_name: Name of the service
-        endpoint: Endpoint path
+        endpoint: Endpoint path (ID segments are recorded as '<id>')
+        sample_rate: Record one in every N successful calls per status; the
+            request counter is incremented by N so rates stay accurate,
+            while the duration histogram receives one observation per N
+            calls. Failed calls are always recorded.
     """
+    endpoint = _normalize_endpoint(endpoint)
+    
     def decorator(f: Callable) -> Callable:
+        method = 'POST'  # Default, can be enhanced
+        
+        # Status -> bundle, so each call does one lookup on a short string
+        # key instead of hashing the full label tuple per metric
+        bundles = {}
+        
+        def bundle(status: str) -> MetricBundle:
+            metrics = bundles.get(status)
+            if metrics is None:
+                metrics = bundles.setdefault(
+                    status, _request_bundle(service_name, endpoint, method, status)
+                )
+            return metrics
+        
+        def record(metrics: MetricBundle, status: str, duration: float, count: int = 1):
+            metrics.requests.inc(count)
+            metrics.duration.observe(duration)
+            
+            # Skip building the extra dict on every request unless it's logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Request metrics recorded", extra={
+                    'service': service_name,
+                    'endpoint': endpoint,
+                    'duration': duration,
+                    'status': status
+                })
+        
         @wraps(f)
         def wrapped(*args, **kwargs):
-            start_time = time.time()
-            status = '200'
-            method = 'POST'  # Default, can be enhanced
+            start_time = time.perf_counter()
             
             try:
                 # Execute the function
                 result = f(*args, **kwargs)
-                
-                # Extract status from response if possible
-                if hasattr(result, 'status_code'):
-                    status = str(result.status_code)
-                elif isinstance(result, tuple) and len(result) > 1:
-                    status = str(result[1])
-                
-                return result
-                
             except Exception as e:
-                status = '500'
-                errors_total.labels(
-                    service=service_name,
-                    error_type=type(e).__name__,
-                    endpoint=endpoint
-                ).inc()
+                _error_counter(service_name, type(e).__name__, endpoint).inc()
+                record(bundle('500'), '500', time.perf_counter() - start_time)
                 raise
-                
-            finally:
-                # Record metrics
-                duration = time.time() - start_time
-                
-                api_requests_total.labels(
-                    service=service_name,
-                    endpoint=endpoint,
-                    method=method,
-                    status=status
-                ).inc()
-                
-                request_duration_seconds.labels(
-                    service=service_name,
-                    endpoint=endpoint,
-                    method=method
-                ).observe(duration)
-                
-                logger.debug("Request metrics recorded", extra={
-                    'service': service_name,
-                    'endpoint': endpoint,
-                    'duration': duration,
-                    'status': status
-                })
+            
+            duration = time.perf_counter() - start_time
+            
+            # Extract status from response if possible
+            if hasattr(result, 'status_code'):
+                status = str(result.status_code)
+            elif isinstance(result, tuple) and len(result) > 1:
+                status = str(result[1])
+            else:
+                status = '200'
+            
+            metrics = bundle(status)
+            if sample_rate == 1:
+                record(metrics, status, duration)
+            elif next(metrics.calls) % sample_rate == 0:
+                record(metrics, status, duration, sample_rate)
+            return result
         
         return wrapped
     return decorator
@@ -296,43 +453,34 @@ def track_strategy_execution(strategy_name: str, ticker: str):
         strategy_name: Name of the strategy
         ticker: Ticker symbol
     """
+    ticker = ticker_label(ticker)
+    
     def decorator(f: Callable) -> Callable:
         @wraps(f)
         def wrapped(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
                 result = f(*args, **kwargs)
                 
                 # Record trade counts and performance if available
                 if isinstance(result, dict):
+                    trades, returns, sharpe = _backtest_metrics(strategy_name, ticker)
+                    
                     if 'total_trades' in result:
-                        backtest_trades_total.labels(
-                            strategy=strategy_name,
-                            ticker=ticker,
-                            signal='all'
-                        ).inc(result['total_trades'])
+                        trades.inc(result['total_trades'])
                     
                     if 'total_return' in result:
-                        backtest_return_percent.labels(
-                            strategy=strategy_name,
-                            ticker=ticker
-                        ).set(result['total_return'])
+                        returns.observe(result['total_return'])
                     
                     if 'sharpe_ratio' in result:
-                        backtest_sharpe_ratio.labels(
-                            strategy=strategy_name,
-                            ticker=ticker
-                        ).set(result['sharpe_ratio'])
+                        sharpe.set(result['sharpe_ratio'])
                 
                 return result
                 
             finally:
-                duration = time.time() - start_time
-                strategy_execution_duration.labels(
-                    strategy=strategy_name,
-                    ticker=ticker
-                ).observe(duration)
+                duration = time.perf_counter() - start_time
+                _strategy_duration(strategy_name, ticker).observe(duration)
         
         return wrapped
     return decorator
@@ -352,57 +500,98 @@ def track_db_operation(service_name: str, operation: str):
         operation: Type of database operation (insert, update, select, delete)
     """
     def decorator(f: Callable) -> Callable:
+        success_counter = _db_operation_counter(service_name, operation, 'success')
+        duration_metric = _db_operation_duration(service_name, operation)
+        
         @wraps(f)
         def wrapped(*args, **kwargs):
-            start_time = time.time()
-            status = 'success'
+            start_time = time.perf_counter()
             
             try:
                 result = f(*args, **kwargs)
-                return result
-                
-            except Exception as e:
-                status = 'failure'
+            except Exception:
+                duration_metric.observe(time.perf_counter() - start_time)
+                _db_operation_counter(service_name, operation, 'failure').inc()
                 raise
-                
-            finally:
-                duration = time.time() - start_time
-                
-                db_operations_total.labels(
-                    service=service_name,
-                    operation=operation,
-                    status=status
-                ).inc()
-                
-                db_operation_duration_seconds.labels(
-                    service=service_name,
-                    operation=operation
-                ).observe(duration)
+            
+            duration_metric.observe(time.perf_counter() - start_time)
+            success_counter.inc()
+            return result
         
         return wrapped
     return decorator
 
 
-def initialize_service_metrics(service_name: str, version: str = "1.0.0"):
+@dataclass(slots=True)
+class ServiceMetrics:
+    """Service-level gauges bound to one service's label"""
+    up: Gauge
+    connections: Gauge
+    
+    def heartbeat(self):
+        """Mark the service as up"""
+        self.up.set(1)
+    
+    def set_active_connections(self, count: int):
+        """Record the current number of active connections"""
+        self.connections.set(count)
+
+
+def initialize_service_metrics(service_name: str, version: str = "1.0.0",
+                               endpoints: Iterable[str] = (),
+                               methods: Iterable[str] = ('POST',),
+                               statuses: Iterable[str] = ('200', '400', '429', '500'),
+                               db_operations: Iterable[str] = ()) -> ServiceMetrics:
     """
     Initialize service-level metrics.
     
+    Label children are created lazily on first use; creating the known
+    combinations here moves that cost to startup and exports them at zero
+    from the first scrape.
+    
     Args:
         service_name: Name of the service
         version: Service version
+        endpoints: Endpoints tracked with track_request_metrics
+        methods: HTTP methods recorded for those endpoints
+        statuses: Response statuses to pre-create request counters for
+        db_operations: Operations tracked with track_db_operation
+    
+    Returns:
+        ServiceMetrics handle for heartbeats and connection counts
     """
     service_info.info({
         'service': service_name,
         'version': version
     })
     
-    service_up.labels(service=service_name).set(1)
-    active_connections.labels(service=service_name).set(0)
+    handle = ServiceMetrics(
+        up=service_up.labels(service=service_name),
+        connections=active_connections.labels(service=service_name)
+    )
+    handle.heartbeat()
+    handle.set_active_connections(0)
+    
+    methods = tuple(methods)
+    statuses = tuple(statuses)
+    for endpoint in endpoints:
+        endpoint = _normalize_endpoint(endpoint)
+        for method in methods:
+            _request_duration(service_name, endpoint, method)
+            for status in statuses:
+                _request_counter(service_name, endpoint, method, status)
+    
+    for operation in db_operations:
+        _db_operation_duration(service_name, operation)
+        for status in ('success', 'failure'):
+            _db_operation_counter(service_name, operation, status)
     
     logger.info("Service metrics initialized", extra={
         'service': service_name,
         'version': version
     })
+    
+    return handle
 
 
 def record_health_check(service_name: str, check_type: str, 
@@ -416,12 +605,6 @@ def record_health_check(service_name: str, check_type: str,
         duration: Check duration in seconds
         is_healthy: Whether the check passed
     """
-    health_check_duration_seconds.labels(
-        service=service_name,
-        check_type=check_type
-    ).observe(duration)
-    
-    health_check_status.labels(
-        service=service_name,
-        check_type=check_type
-    ).set(1 if is_healthy else 0)
+    duration_metric, status_metric = _health_check_metrics(service_name, check_type)
+    duration_metric.observe(duration)
+    status_metric.set(1 if is_healthy else 0)
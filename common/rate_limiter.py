@@ -9,15 +9,80 @@ Implements token bucket algorithm for API rate limiting with:
 - Decorator pattern for easy application
 """
 
+import logging
+import os
+import threading
 import time
 import redis
-from functools import wraps
+from dataclasses import dataclass
+from functools import lru_cache, wraps
 from typing import Optional, Tuple
-from flask import request, jsonify
+from flask import current_app, request, jsonify
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on pooled Redis connections per process; size it to roughly
+# twice the worker thread count. Checkouts wait up to REDIS_POOL_TIMEOUT
+# seconds for a free connection instead of opening new ones under bursts.
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', '50'))
+REDIS_POOL_TIMEOUT = float(os.getenv('REDIS_POOL_TIMEOUT', '1.0'))
+
+# Token bucket refill + consume, run atomically inside Redis so concurrent
+# workers can't interleave between reading and writing the bucket.
+#   KEYS: tokens key, timestamp key
+#   ARGV: now (epoch seconds), burst, refill rate (tokens/s), key TTL (s),
+#         tokens wanted (up to this many whole tokens are taken)
+# Returns {tokens taken (0 = denied), tokens left}; tokens left is returned
+# as a string because Redis truncates Lua numbers to integers.
+TOKEN_BUCKET_LUA = """
+local now = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local rate = tonumber(ARGV[3])
+local wanted = tonumber(ARGV[5]) or 1
+local tokens = tonumber(redis.call('GET', KEYS[1])) or burst
+local last_update = tonumber(redis.call('GET', KEYS[2])) or now
+
+tokens = math.min(burst, tokens + (now - last_update) * rate)
+
+if tokens >= 1 then
+    local taken = math.min(wanted, math.floor(tokens))
+    tokens = tokens - taken
+    redis.call('SET', KEYS[1], tostring(tokens), 'EX', ARGV[4])
+    redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[4])
+    return {taken, tostring(tokens)}
+end
+
+return {0, tostring(tokens)}
+"""
+
+
+@dataclass(slots=True)
+class RateLimitResult:
+    """Outcome of a single rate limit check"""
+    allowed: bool
+    tokens_remaining: int
+    reset_time: int
+    retry_after: int = 0
+    # Set when the check was skipped: 'disabled' or 'rate_limit_check_failed'
+    skipped: Optional[str] = None
+
+
+@lru_cache(maxsize=16384)
+def _bucket_keys(resource: str, identifier: str) -> Tuple[bytes, bytes]:
+    """
+    Redis keys for a rate limit bucket, pre-encoded for the client.
+    
+    Args:
+        resource: Resource being rate limited (e.g., 'yfinance')
+        identifier: Unique identifier (e.g., IP address, user ID)
+        
+    Returns:
+        Tuple of (tokens key, last update timestamp key)
+    """
+    prefix = f"rate_limit:{resource}:{identifier}".encode()
+    return prefix + b":tokens", prefix + b":timestamp"
+
 
 class RateLimiter:
     """
@@ -25,24 +90,48 @@ class RateLimiter:
     
     The token bucket algorithm allows for burst traffic while maintaining
     average rate limits over time.
+    
+    With local_batch > 1 the limiter leases up to that many tokens from
+    Redis per round-trip and spends them in-process, so most allowed
+    requests skip Redis. Leased tokens are already debited in Redis; any
+    left unused after local_ttl are forfeited, so keep the batch small
+    relative to the burst size.
     """
     
-    def __init__(self, redis_url: str = "redis://localhost:6379/0"):
+    def __init__(self, redis_url: str = "redis://localhost:6379/0",
+                 local_batch: int = 1, local_ttl: float = 1.0):
         """
         Initialize rate limiter with Redis connection.
         
         Args:
             redis_url: Redis connection URL
+            local_batch: Tokens to lease from Redis per round-trip (1 sends
+                every check to Redis)
+            local_ttl: Seconds a lease may be spent locally
         """
+        self.local_batch = max(1, int(local_batch))
+        self.local_ttl = local_ttl
+        
+        # (resource, identifier) -> [leased tokens left, expires_at (monotonic),
+        #                            tokens left in Redis when leased]
+        self._leases = {}
+        self._lease_lock = threading.Lock()
+        
         try:
-            self.redis_client = redis.from_url(
+            # Replies stay as bytes (the bucket numbers parse with float()
+            # directly); redis-py uses the hiredis parser when installed
+            pool = redis.BlockingConnectionPool.from_url(
                 redis_url,
-                decode_responses=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=REDIS_POOL_TIMEOUT,
+                socket_keepalive=True,
                 socket_connect_timeout=5,
                 socket_timeout=5
             )
+            self.redis_client = redis.Redis(connection_pool=pool)
             # Test connection
             self.redis_client.ping()
+            self._token_bucket = self.redis_client.register_script(TOKEN_BUCKET_LUA)
             self.enabled = True
             logger.info("Rate limiter initialized with Redis", extra={
                 'redis_url': redis_url.split('@')[-1]  # Hide password
@@ -54,33 +143,60 @@ class RateLimiter:
             self.redis_client = None
             self.enabled = False
     
-    def _get_bucket_key(self, resource: str, identifier: str) -> str:
+    def _spend_leased_token(self, resource: str, identifier: str) -> Optional[float]:
+        """
+        Spend one locally leased token, if a live lease exists.
+        
+        Returns:
+            Tokens still available to this identifier (leased + in Redis),
+            or None if the check has to go to Redis
+        """
+        key = (resource, identifier)
+        with self._lease_lock:
+            lease = self._leases.get(key)
+            if lease is None:
+                return None
+            if lease[0] < 1 or lease[1] <= time.monotonic():
+                del self._leases[key]
+                return None
+            lease[0] -= 1
+            return lease[0] + lease[2]
+    
+    def _current_tokens(self, resource: str, identifier: str,
+                        refill_rate: float, burst: int, current_time: float) -> float:
         """
-        Generate Redis key for rate limit bucket.
+        Read a bucket and apply the refill since its last update (read-only).
         
         Args:
-            resource: Resource being rate limited (e.g., 'yfinance')
-            identifier: Unique identifier (e.g., IP address, user ID)
+            resource: Resource being rate limited
+            identifier: Unique identifier
+            refill_rate: Tokens added per second
+            burst: Burst capacity
+            current_time: Current epoch time in seconds
             
         Returns:
-            Redis key string
+            Tokens currently available
         """
-        return f"rate_limit:{resource}:{identifier}"
-    
-    def _get_tokens_key(self, resource: str, identifier: str) -> str:
-        """Get Redis key for token count."""
-        return f"{self._get_bucket_key(resource, identifier)}:tokens"
+        results = self.redis_client.mget(*_bucket_keys(resource, identifier))
+        
+        current_tokens = float(results[0]) if results[0] else burst
+        last_update = float(results[1]) if results[1] else current_time
+        
+        return min(burst, current_tokens + (current_time - last_update) * refill_rate)
     
-    def _get_timestamp_key(self, resource: str, identifier: str) -> str:
-        """Get Redis key for last update timestamp."""
-        return f"{self._get_bucket_key(resource, identifier)}:timestamp"
+    @staticmethod
+    def _seconds_until_full(current_tokens: float, burst: int, refill_rate: float) -> int:
+        """Whole seconds until the bucket is back at capacity (0 if full)."""
+        if current_tokens >= burst:
+            return 0
+        return int((burst - current_tokens) / refill_rate) + 1
     
     def check_rate_limit(self, 
                         resource: str,
                         identifier: str,
                         calls: int = 48,
                         period: int = 60,
-                        burst: int = 10) -> Tuple[bool, dict]:
+                        burst: int = 10) -> RateLimitResult:
         """
         Check if request is within rate limit using token bucket algorithm.
         
@@ -92,66 +208,56 @@ class RateLimiter:
             burst: Maximum burst capacity (tokens in bucket)
             
         Returns:
-            Tuple of (allowed: bool, info: dict)
-            info contains: tokens_remaining, reset_time, retry_after
+            RateLimitResult with allowed, tokens_remaining, reset_time
+            and retry_after
         """
         if not self.enabled:
             # Rate limiting disabled, allow all requests
-            return True, {
-                'tokens_remaining': burst,
-                'reset_time': 0,
-                'retry_after': 0,
-                'rate_limiting': 'disabled'
-            }
+            return RateLimitResult(True, burst, 0, skipped='disabled')
+        
+        # Calculate token refill rate (tokens per second)
+        refill_rate = calls / period
+        
+        if self.local_batch > 1:
+            available = self._spend_leased_token(resource, identifier)
+            if available is not None:
+                return RateLimitResult(
+                    True, int(available), int(time.time() + (burst - available) / refill_rate)
+                )
         
         try:
-            tokens_key = self._get_tokens_key(resource, identifier)
-            timestamp_key = self._get_timestamp_key(resource, identifier)
+            tokens_key, timestamp_key = _bucket_keys(resource, identifier)
             
             current_time = time.time()
             
-            # Get current state from Redis
-            pipe = self.redis_client.pipeline()
-            pipe.get(tokens_key)
-            pipe.get(timestamp_key)
-            results = pipe.execute()
-            
-            current_tokens = float(results[0]) if results[0] else burst
-            last_update = float(results[1]) if results[1] else current_time
-            
-            # Calculate token refill rate (tokens per second)
-            refill_rate = calls / period
-            
-            # Calculate time elapsed and tokens to add
-            time_elapsed = current_time - last_update
-            tokens_to_add = time_elapsed * refill_rate
-            
-            # Refill tokens (capped at burst capacity)
-            current_tokens = min(burst, current_tokens + tokens_to_add)
-            
-            # Check if we have at least 1 token available
-            if current_tokens >= 1.0:
-                # Consume 1 token
-                current_tokens -= 1.0
-                allowed = True
-                
-                # Update Redis with new state
-                pipe = self.redis_client.pipeline()
-                pipe.set(tokens_key, current_tokens, ex=period * 2)
-                pipe.set(timestamp_key, current_time, ex=period * 2)
-                pipe.execute()
+            # Refill, consume and persist the bucket in one atomic round-trip
+            taken, current_tokens = self._token_bucket(
+                keys=[tokens_key, timestamp_key],
+                args=[current_time, burst, refill_rate, period * 2, self.local_batch]
+            )
+            taken = int(taken)
+            current_tokens = float(current_tokens)
+            
+            if taken >= 1:
+                if taken > 1:
+                    # Keep the extra tokens for the next checks in this process
+                    with self._lease_lock:
+                        self._leases[(resource, identifier)] = [
+                            taken - 1, time.monotonic() + self.local_ttl, current_tokens
+                        ]
+                    current_tokens += taken - 1
                 
-                logger.debug("Rate limit check passed", extra={
-                    'resource': resource,
-                    'identifier': identifier,
-                    'tokens_remaining': current_tokens
-                })
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Rate limit check passed", extra={
+                        'resource': resource,
+                        'identifier': identifier,
+                        'tokens_remaining': current_tokens
+                    })
                 
-                return True, {
-                    'tokens_remaining': int(current_tokens),
-                    'reset_time': int(current_time + (burst - current_tokens) / refill_rate),
-                    'retry_after': 0
-                }
+                return RateLimitResult(
+                    True, int(current_tokens),
+                    int(current_time + (burst - current_tokens) / refill_rate)
+                )
             else:
                 # Not enough tokens, rate limit exceeded
                 tokens_needed = 1.0 - current_tokens
@@ -164,11 +270,9 @@ class RateLimiter:
                     'retry_after': retry_after
                 })
                 
-                return False, {
-                    'tokens_remaining': 0,
-                    'reset_time': int(current_time + retry_after),
-                    'retry_after': int(retry_after) + 1
-                }
+                return RateLimitResult(
+                    False, 0, int(current_time + retry_after), int(retry_after) + 1
+                )
                 
         except Exception as e:
             logger.error("Rate limit check failed", extra={
@@ -176,12 +280,7 @@ class RateLimiter:
                 'resource': resource
             }, exc_info=True)
             # On error, allow request (fail open)
-            return True, {
-                'tokens_remaining': burst,
-                'reset_time': 0,
-                'retry_after': 0,
-                'error': 'rate_limit_check_failed'
-            }
+            return RateLimitResult(True, burst, 0, skipped='rate_limit_check_failed')
     
     def time_until_reset(self, resource: str, identifier: str, 
                         calls: int = 48, period: int = 60, 
@@ -203,34 +302,12 @@ class RateLimiter:
             return 0
         
         try:
-            tokens_key = self._get_tokens_key(resource, identifier)
-            timestamp_key = self._get_timestamp_key(resource, identifier)
-            
-            current_time = time.time()
-            
-            pipe = self.redis_client.pipeline()
-            pipe.get(tokens_key)
-            pipe.get(timestamp_key)
-            results = pipe.execute()
-            
-            current_tokens = float(results[0]) if results[0] else burst
-            last_update = float(results[1]) if results[1] else current_time
-            
-            if current_tokens >= burst:
-                return 0
-            
             refill_rate = calls / period
-            time_elapsed = current_time - last_update
-            tokens_to_add = time_elapsed * refill_rate
-            current_tokens = min(burst, current_tokens + tokens_to_add)
-            
-            if current_tokens >= burst:
-                return 0
-            
-            tokens_needed = burst - current_tokens
-            time_needed = tokens_needed / refill_rate
+            current_tokens = self._current_tokens(
+                resource, identifier, refill_rate, burst, time.time()
+            )
             
-            return int(time_needed) + 1
+            return self._seconds_until_full(current_tokens, burst, refill_rate)
             
         except Exception as e:
             logger.error("Failed to calculate reset time", extra={
@@ -253,13 +330,10 @@ class RateLimiter:
             return False
         
         try:
-            tokens_key = self._get_tokens_key(resource, identifier)
-            timestamp_key = self._get_timestamp_key(resource, identifier)
-            
-            pipe = self.redis_client.pipeline()
-            pipe.delete(tokens_key)
-            pipe.delete(timestamp_key)
-            pipe.execute()
+            # One multi-key DEL; no pipeline object needed
+            self.redis_client.delete(*_bucket_keys(resource, identifier))
+            with self._lease_lock:
+                self._leases.pop((resource, identifier), None)
             
             logger.info("Rate limit reset", extra={
                 'resource': resource,
@@ -300,23 +374,10 @@ class RateLimiter:
             }
         
         try:
-            tokens_key = self._get_tokens_key(resource, identifier)
-            timestamp_key = self._get_timestamp_key(resource, identifier)
-            
-            current_time = time.time()
-            
-            pipe = self.redis_client.pipeline()
-            pipe.get(tokens_key)
-            pipe.get(timestamp_key)
-            results = pipe.execute()
-            
-            current_tokens = float(results[0]) if results[0] else burst
-            last_update = float(results[1]) if results[1] else current_time
-            
             refill_rate = calls / period
-            time_elapsed = current_time - last_update
-            tokens_to_add = time_elapsed * refill_rate
-            current_tokens = min(burst, current_tokens + tokens_to_add)
+            current_tokens = self._current_tokens(
+                resource, identifier, refill_rate, burst, time.time()
+            )
             
             return {
                 'enabled': True,
@@ -324,7 +385,7 @@ class RateLimiter:
                 'capacity': burst,
                 'calls_per_period': calls,
                 'period_seconds': period,
-                'reset_time': self.time_until_reset(resource, identifier, calls, period, burst),
+                'reset_time': self._seconds_until_full(current_tokens, burst, refill_rate),
                 'refill_rate': round(refill_rate, 3)
             }
             
@@ -338,11 +399,53 @@ class RateLimiter:
             }
 
 
+DEFAULT_REDIS_URL = 'redis://localhost:6379/0'
+
+# Serializes lazy creation of an app's limiter by concurrent first requests
+_app_limiter_lock = threading.Lock()
+
+# Default for rate_limit(limiter=...): look up the current app's limiter per request
+_APP_LIMITER = object()
+
+
+def init_rate_limiter(app, redis_url: Optional[str] = None) -> RateLimiter:
+    """
+    Create the app's rate limiter at app-factory time.
+    
+    Args:
+        app: Flask application
+        redis_url: Redis connection URL (defaults to app.config['REDIS_URL'])
+    
+    Returns:
+        The RateLimiter attached as app.rate_limiter
+    """
+    app.rate_limiter = RateLimiter(redis_url or app.config.get('REDIS_URL', DEFAULT_REDIS_URL))
+    return app.rate_limiter
+
+
+def _resolve_app_limiter() -> Optional[RateLimiter]:
+    """
+    The current app's rate limiter, created on first use if the app factory
+    didn't call init_rate_limiter. None means rate limiting is unavailable.
+    """
+    app = current_app._get_current_object()
+    try:
+        return app.rate_limiter
+    except AttributeError:
+        pass
+    
+    with _app_limiter_lock:
+        if not hasattr(app, 'rate_limiter'):
+            init_rate_limiter(app)
+        return app.rate_limiter
+
+
 def rate_limit(calls: int = 48, 
                period: int = 60, 
                resource: str = "api",
                burst: Optional[int] = None,
-               identifier_fn=None):
+               identifier_fn=None,
+               limiter: Optional[RateLimiter] = _APP_LIMITER):
     """
     Decorator for rate limiting Flask routes.
     
@@ -358,6 +461,8 @@ def rate_limit(calls: int = 48,
         resource: Resource being rate limited
         burst: Burst capacity (defaults to calls/5)
         identifier_fn: Function to get identifier (defaults to IP address)
+        limiter: RateLimiter to use, normally app.rate_limiter; None disables
+            rate limiting. When omitted, the app's limiter is looked up per request.
     
     Returns:
         Decorated function with rate limiting
@@ -368,14 +473,14 @@ def rate_limit(calls: int = 48,
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # Get rate limiter from app config or create new one
-            from flask import current_app
-            
-            if not hasattr(current_app, 'rate_limiter'):
-                redis_url = current_app.config.get('REDIS_URL', 'redis://localhost:6379/0')
-                current_app.rate_limiter = RateLimiter(redis_url)
+            if limiter is _APP_LIMITER:
+                active_limiter = _resolve_app_limiter()
+            else:
+                active_limiter = limiter
             
-            limiter = current_app.rate_limiter
+            # Rate limiting unavailable (app failed to create a limiter)
+            if active_limiter is None:
+                return f(*args, **kwargs)
             
             # Get identifier (IP address by default)
             if identifier_fn:
@@ -384,7 +489,7 @@ def rate_limit(calls: int = 48,
                 identifier = request.remote_addr or 'unknown'
             
             # Check rate limit
-            allowed, info = limiter.check_rate_limit(
+            result = active_limiter.check_rate_limit(
                 resource=resource,
                 identifier=identifier,
                 calls=calls,
@@ -392,17 +497,17 @@ def rate_limit(calls: int = 48,
                 burst=burst
             )
             
-            if not allowed:
+            if not result.allowed:
                 logger.warning("Rate limit exceeded for request", extra={
                     'resource': resource,
                     'identifier': identifier,
-                    'retry_after': info['retry_after']
+                    'retry_after': result.retry_after
                 })
                 
                 response = jsonify({
                     'error': 'RATE_LIMIT_EXCEEDED',
                     'message': f'Rate limit exceeded for {resource}',
-                    'retry_after': info['retry_after'],
+                    'retry_after': result.retry_after,
                     'limit': {
                         'calls': calls,
                         'period': period,
@@ -410,10 +515,10 @@ def rate_limit(calls: int = 48,
                     }
                 })
                 response.status_code = 429
-                response.headers['Retry-After'] = str(info['retry_after'])
+                response.headers['Retry-After'] = str(result.retry_after)
                 response.headers['X-RateLimit-Limit'] = str(calls)
-                response.headers['X-RateLimit-Remaining'] = str(info['tokens_remaining'])
-                response.headers['X-RateLimit-Reset'] = str(info['reset_time'])
+                response.headers['X-RateLimit-Remaining'] = str(result.tokens_remaining)
+                response.headers['X-RateLimit-Reset'] = str(result.reset_time)
                 return response
             
             # Add rate limit headers to response
@@ -422,8 +527,8 @@ def rate_limit(calls: int = 48,
             # Add headers if response is a Flask response object
             if hasattr(response, 'headers'):
                 response.headers['X-RateLimit-Limit'] = str(calls)
-                response.headers['X-RateLimit-Remaining'] = str(info['tokens_remaining'])
-                response.headers['X-RateLimit-Reset'] = str(info['reset_time'])
+                response.headers['X-RateLimit-Remaining'] = str(result.tokens_remaining)
+                response.headers['X-RateLimit-Reset'] = str(result.reset_time)
             
             return response
         
@@ -4,21 +4,39 @@ Interactive visualization and control interface
 """
 import streamlit as st
 import requests
-import pandas as pd
+from urllib3.util.retry import Retry
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import islice
 import json
 import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
 from PIL import Image
 
 # Add parent directory to path for common module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from common.logger import get_logger, set_correlation_id
 
+try:
+    import orjson
+    
+    # Works on raw bytes in both directions, several times faster than the
+    # stdlib codec on large backtest payloads
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - orjson is in requirements
+    _loads = json.loads
+    
+    def _dumps(obj):
+        """Encode a request body with the stdlib encoder"""
+        return json.dumps(obj).encode('utf-8')
+
+# Request bodies are pre-encoded JSON bytes sent with data=, not json=
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
 # Initialize logger
 logger = get_logger(__name__, service_name='dashboard')
 
@@ -32,6 +50,24 @@ logger.info("Dashboard starting", extra={
     'strategy_service_url': STRATEGY_SERVICE_URL
 })
 
+
+@st.cache_resource
+def get_http():
+    """
+    HTTP session shared by all backend calls in this process, so requests
+    reuse pooled keep-alive connections instead of reconnecting each time.
+    
+    Failed connections are retried twice with a short backoff; urllib3 only
+    retries a POST when it never reached the service, so runs aren't resent.
+    """
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.2)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 # Load custom page icon
 icon_path = Path(__file__).parent / "static" / "stock.png"
 try:
@@ -83,87 +119,134 @@ st.markdown("---")
 st.sidebar.title("Configuration")
 st.sidebar.markdown("---")
 
-# Popular stock tickers database
-STOCK_TICKERS = {
-    # Tech Giants
-    "AAPL": "Apple Inc.",
-    "MSFT": "Microsoft Corporation",
-    "GOOGL": "Alphabet Inc. (Google)",
-    "AMZN": "Amazon.com Inc.",
-    "META": "Meta Platforms Inc. (Facebook)",
-    "NVDA": "NVIDIA Corporation",
-    "TSLA": "Tesla Inc.",
-    "NFLX": "Netflix Inc.",
-    "AMD": "Advanced Micro Devices",
-    "INTC": "Intel Corporation",
-    "ORCL": "Oracle Corporation",
-    "ADBE": "Adobe Inc.",
-    "CRM": "Salesforce Inc.",
-    "CSCO": "Cisco Systems",
-    "IBM": "IBM Corporation",
-    
-    # Finance
-    "JPM": "JPMorgan Chase & Co.",
-    "BAC": "Bank of America Corp.",
-    "WFC": "Wells Fargo & Company",
-    "GS": "Goldman Sachs Group",
-    "MS": "Morgan Stanley",
-    "C": "Citigroup Inc.",
-    "V": "Visa Inc.",
-    "MA": "Mastercard Inc.",
-    "AXP": "American Express",
-    
-    # Consumer & Retail
-    "WMT": "Walmart Inc.",
-    "HD": "Home Depot Inc.",
-    "MCD": "McDonald's Corporation",
-    "NKE": "Nike Inc.",
-    "SBUX": "Starbucks Corporation",
-    "TGT": "Target Corporation",
-    "COST": "Costco Wholesale",
-    "KO": "Coca-Cola Company",
-    "PEP": "PepsiCo Inc.",
-    
-    # Healthcare & Pharma
-    "JNJ": "Johnson & Johnson",
-    "UNH": "UnitedHealth Group",
-    "PFE": "Pfizer Inc.",
-    "ABBV": "AbbVie Inc.",
-    "TMO": "Thermo Fisher Scientific",
-    "MRK": "Merck & Co.",
-    "LLY": "Eli Lilly and Company",
-    
-    # Energy
-    "XOM": "Exxon Mobil Corporation",
-    "CVX": "Chevron Corporation",
-    "COP": "ConocoPhillips",
-    
-    # Telecommunications
-    "T": "AT&T Inc.",
-    "VZ": "Verizon Communications",
-    
-    # Aerospace & Defense
-    "BA": "Boeing Company",
-    "LMT": "Lockheed Martin",
-    
-    # Automotive
-    "F": "Ford Motor Company",
-    "GM": "General Motors Company",
+@st.cache_resource
+def get_ticker_catalog():
+    """
+    Popular stock tickers as a read-only symbol -> name mapping, plus the
+    (symbol, name) pairs sorted by symbol.
     
-    # Crypto ETFs
-    "BTC-USD": "Bitcoin USD",
-    "ETH-USD": "Ethereum USD",
+    Streamlit re-executes this script on every rerun, so the catalog is
+    built and sorted once per process here rather than at module level.
+    """
+    tickers = {
+        # Tech Giants
+        "AAPL": "Apple Inc.",
+        "MSFT": "Microsoft Corporation",
+        "GOOGL": "Alphabet Inc. (Google)",
+        "AMZN": "Amazon.com Inc.",
+        "META": "Meta Platforms Inc. (Facebook)",
+        "NVDA": "NVIDIA Corporation",
+        "TSLA": "Tesla Inc.",
+        "NFLX": "Netflix Inc.",
+        "AMD": "Advanced Micro Devices",
+        "INTC": "Intel Corporation",
+        "ORCL": "Oracle Corporation",
+        "ADBE": "Adobe Inc.",
+        "CRM": "Salesforce Inc.",
+        "CSCO": "Cisco Systems",
+        "IBM": "IBM Corporation",
+        
+        # Finance
+        "JPM": "JPMorgan Chase & Co.",
+        "BAC": "Bank of America Corp.",
+        "WFC": "Wells Fargo & Company",
+        "GS": "Goldman Sachs Group",
+        "MS": "Morgan Stanley",
+        "C": "Citigroup Inc.",
+        "V": "Visa Inc.",
+        "MA": "Mastercard Inc.",
+        "AXP": "American Express",
+        
+        # Consumer & Retail
+        "WMT": "Walmart Inc.",
+        "HD": "Home Depot Inc.",
+        "MCD": "McDonald's Corporation",
+        "NKE": "Nike Inc.",
+        "SBUX": "Starbucks Corporation",
+        "TGT": "Target Corporation",
+        "COST": "Costco Wholesale",
+        "KO": "Coca-Cola Company",
+        "PEP": "PepsiCo Inc.",
+        
+        # Healthcare & Pharma
+        "JNJ": "Johnson & Johnson",
+        "UNH": "UnitedHealth Group",
+        "PFE": "Pfizer Inc.",
+        "ABBV": "AbbVie Inc.",
+        "TMO": "Thermo Fisher Scientific",
+        "MRK": "Merck & Co.",
+        "LLY": "Eli Lilly and Company",
+        
+        # Energy
+        "XOM": "Exxon Mobil Corporation",
+        "CVX": "Chevron Corporation",
+        "COP": "ConocoPhillips",
+        
+        # Telecommunications
+        "T": "AT&T Inc.",
+        "VZ": "Verizon Communications",
+        
+        # Aerospace & Defense
+        "BA": "Boeing Company",
+        "LMT": "Lockheed Martin",
+        
+        # Automotive
+        "F": "Ford Motor Company",
+        "GM": "General Motors Company",
+        
+        # Crypto ETFs
+        "BTC-USD": "Bitcoin USD",
+        "ETH-USD": "Ethereum USD",
+        
+        # Index ETFs
+        "SPY": "SPDR S&P 500 ETF",
+        "QQQ": "Invesco QQQ ETF",
+        "DIA": "SPDR Dow Jones ETF",
+        "IWM": "iShares Russell 2000 ETF",
+    }
+    return MappingProxyType(tickers), tuple(sorted(tickers.items()))
+
+
+STOCK_TICKERS, TICKER_PAIRS = get_ticker_catalog()
+
+# Most matches offered in the ticker dropdown; selectbox gets slow to render
+# and filter as its option list grows
+MAX_TICKER_MATCHES = 100
+
+
+@st.cache_resource
+def build_ticker_search_index():
+    """
+    ("SYMBOL - Name", lowercased search text) pairs, built once per process.
     
-    # Index ETFs
-    "SPY": "SPDR S&P 500 ETF",
-    "QQQ": "Invesco QQQ ETF",
-    "DIA": "SPDR Dow Jones ETF",
-    "IWM": "iShares Russell 2000 ETF",
-}
+    The index is immutable, so it's cached as a shared resource rather than
+    with cache_data, which would unpickle a fresh copy on every rerun.
+    """
+    return tuple(
+        (f"{symbol} - {name}", f"{symbol} {name}".lower())
+        for symbol, name in TICKER_PAIRS
+    )
+
+
+def matching_ticker_options(query):
+    """Ticker options matching the search query, capped at MAX_TICKER_MATCHES"""
+    query = query.strip().lower()
+    matches = (
+        option for option, search_text in build_ticker_search_index()
+        if query in search_text
+    )
+    return list(islice(matches, MAX_TICKER_MATCHES))
 
-# Create searchable options
-ticker_options = [f"{symbol} - {name}" for symbol, name in sorted(STOCK_TICKERS.items())]
-ticker_options.insert(0, "Type to search or select...")
+
+# Filter tickers server-side, then offer only the matches in the dropdown
+ticker_query = st.sidebar.text_input(
+    "Search Ticker",
+    placeholder="Symbol or company name",
+    help="Narrow the ticker list by stock symbol or company name"
+)
+ticker_options = ["Type to search or select..."] + matching_ticker_options(ticker_query)
+if ticker_query and len(ticker_options) == 1:
+    st.sidebar.caption("No tickers match your search")
 
 # Ticker selection with searchable dropdown
 selected_option = st.sidebar.selectbox(
@@ -205,127 +288,189 @@ strategy = st.sidebar.selectbox(
     }[x]
 )
 
-# Strategy parameters
-st.sidebar.markdown("### Strategy Parameters")
-parameters = {}
+# Strategy parameters, batched in a form so adjusting several widgets costs
+# one rerun when the run is submitted instead of one rerun per widget change
+with st.sidebar.form("strategy_params", border=False):
+    st.markdown("### Strategy Parameters")
+    parameters = {}
 
-if strategy == "sma":
-    parameters['short_window'] = st.sidebar.slider(
-        "Short Window", 5, 50, 20,
-        help="Number of days for short-term moving average (faster signal)"
-    )
-    parameters['long_window'] = st.sidebar.slider(
-        "Long Window", 20, 200, 50,
-        help="Number of days for long-term moving average (slower signal)"
-    )
-elif strategy == "mean_reversion":
-    parameters['window'] = st.sidebar.slider(
-        "Window", 5, 50, 20,
-        help="Lookback period for calculating moving average"
-    )
-    parameters['num_std'] = st.sidebar.slider(
-        "Number of Std Dev", 1.0, 3.0, 2.0, 0.5,
-        help="Number of standard deviations for bands (higher = wider bands)"
-    )
-elif strategy == "momentum":
-    parameters['lookback'] = st.sidebar.slider(
-        "Lookback Period", 5, 30, 10,
-        help="Number of days to calculate momentum"
-    )
+    if strategy == "sma":
+        parameters['short_window'] = st.slider(
+            "Short Window", 5, 50, 20,
+            help="Number of days for short-term moving average (faster signal)"
+        )
+        parameters['long_window'] = st.slider(
+            "Long Window", 20, 200, 50,
+            help="Number of days for long-term moving average (slower signal)"
+        )
+    elif strategy == "mean_reversion":
+        parameters['window'] = st.slider(
+            "Window", 5, 50, 20,
+            help="Lookback period for calculating moving average"
+        )
+        parameters['num_std'] = st.slider(
+            "Number of Std Dev", 1.0, 3.0, 2.0, 0.5,
+            help="Number of standard deviations for bands (higher = wider bands)"
+        )
+    elif strategy == "momentum":
+        parameters['lookback'] = st.slider(
+            "Lookback Period", 5, 30, 10,
+            help="Number of days to calculate momentum"
+        )
 
-# Initial capital
-initial_capital = st.sidebar.number_input("Initial Capital ($)", min_value=1000, max_value=1000000, value=10000, step=1000)
+    # Initial capital
+    initial_capital = st.number_input("Initial Capital ($)", min_value=1000, max_value=1000000, value=10000, step=1000)
 
-# Risk Management Parameters
-st.sidebar.markdown("---")
-st.sidebar.markdown("### Risk Management")
+    # Risk Management Parameters
+    st.markdown("---")
+    st.markdown("### Risk Management")
 
-enable_risk_mgmt = st.sidebar.checkbox(
-    "Enable Risk Management",
-    value=True,
-    help="Apply transaction costs and position size limits"
-)
+    enable_risk_mgmt = st.checkbox(
+        "Enable Risk Management",
+        value=True,
+        help="Apply transaction costs and position size limits"
+    )
 
-with st.sidebar.expander("Risk Parameters"):
-    commission = st.slider(
-        "Commission (%)", 
-        0.0, 1.0, 0.1, 0.05,
-        help="Trading commission as percentage (0.1% = $1 per $1000)"
-    ) / 100
+    with st.expander("Risk Parameters"):
+        commission = st.slider(
+            "Commission (%)", 
+            0.0, 1.0, 0.1, 0.05,
+            help="Trading commission as percentage (0.1% = $1 per $1000)"
+        ) / 100
     
-    slippage = st.slider(
-        "Slippage (%)", 
-        0.0, 0.5, 0.05, 0.01,
-        help="Expected slippage due to market impact"
-    ) / 100
+        slippage = st.slider(
+            "Slippage (%)", 
+            0.0, 0.5, 0.05, 0.01,
+            help="Expected slippage due to market impact"
+        ) / 100
     
-    max_position_pct = st.slider(
-        "Max Position Size (%)", 
-        5, 100, 95, 5,
-        help="Maximum portfolio percentage in single position"
-    ) / 100
+        max_position_pct = st.slider(
+            "Max Position Size (%)", 
+            5, 100, 95, 5,
+            help="Maximum portfolio percentage in single position"
+        ) / 100
     
-    stop_loss_pct = st.slider(
-        "Stop Loss (%)", 
-        1, 10, 5, 1,
-        help="Stop loss percentage below entry"
-    ) / 100
-
-with st.sidebar.expander("Advanced Features"):
-    use_kelly = st.checkbox(
-        "Use Kelly Criterion",
-        value=False,
-        help="Use Kelly Criterion for position sizing after 10+ trades (more aggressive)"
-    )
+        stop_loss_pct = st.slider(
+            "Stop Loss (%)", 
+            1, 10, 5, 1,
+            help="Stop loss percentage below entry"
+        ) / 100
+
+    with st.expander("Advanced Features"):
+        use_kelly = st.checkbox(
+            "Use Kelly Criterion",
+            value=False,
+            help="Use Kelly Criterion for position sizing after 10+ trades (more aggressive)"
+        )
     
-    enable_stop_loss = st.checkbox(
-        "Enable Automatic Stop-Loss",
-        value=True,
-        help="Automatically exit positions when stop-loss is hit"
-    )
+        enable_stop_loss = st.checkbox(
+            "Enable Automatic Stop-Loss",
+            value=True,
+            help="Automatically exit positions when stop-loss is hit"
+        )
     
-    show_risk_reward = st.checkbox(
-        "Show Risk-Reward Ratios",
-        value=True,
-        help="Display risk-reward ratio for each trade"
+        show_risk_reward = st.checkbox(
+            "Show Risk-Reward Ratios",
+            value=True,
+            help="Display risk-reward ratio for each trade"
+        )
+    
+    run_strategy_btn = st.form_submit_button(
+        "Run Strategy", use_container_width=True, disabled=(ticker is None)
     )
 
+# Most points the equity chart sends to the browser when downsampling is on
+MAX_PLOT_POINTS = 2000
+
+downsample_plots = st.sidebar.checkbox(
+    "Downsample large plots",
+    value=True,
+    help=f"Reduce the equity curve to at most {MAX_PLOT_POINTS:,} points, keeping its shape"
+)
+
 st.sidebar.markdown("---")
 
-# Service Status
-with st.sidebar.expander("Service Status"):
-    try:
-        # Check Data Service
-        data_health = requests.get(f'{DATA_SERVICE_URL}/health', timeout=3)
-        if data_health.status_code == 200:
-            st.success("✅ Data Service: Healthy")
-        else:
-            st.error("❌ Data Service: Unhealthy")
-    except (requests.exceptions.RequestException, requests.exceptions.Timeout) as e:
-        st.error(f"❌ Data Service: Unreachable ({type(e).__name__})")
-    
+def probe_health(url):
+    """Status code of a health probe, or the exception name if unreachable"""
     try:
-        # Check Strategy Engine
-        strategy_health = requests.get(f'{STRATEGY_SERVICE_URL}/health', timeout=3)
-        if strategy_health.status_code == 200:
-            st.success("✅ Strategy Engine: Healthy")
-        else:
-            st.error("❌ Strategy Engine: Unhealthy")
-    except (requests.exceptions.RequestException, requests.exceptions.Timeout) as e:
-        st.error(f"❌ Strategy Engine: Unreachable ({type(e).__name__})")
+        return get_http().get(url, timeout=3).status_code
+    except requests.exceptions.RequestException as e:
+        return type(e).__name__
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def probe_services():
+    """
+    Probe both services concurrently, so the sidebar waits for the slower one
+    instead of both in turn. Results are reused for 10 seconds so widget
+    interactions don't re-probe on every rerun.
+    """
+    urls = (f'{DATA_SERVICE_URL}/health', f'{STRATEGY_SERVICE_URL}/health')
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return tuple(executor.map(probe_health, urls))
+
+
+@st.fragment(run_every=10)
+def render_service_status():
+    """Service Status panel; refreshes on its own timer without rerunning the app"""
+    with st.expander("Service Status"):
+        data_status, strategy_status = probe_services()
+        
+        for service, status in (("Data Service", data_status), ("Strategy Engine", strategy_status)):
+            if status == 200:
+                st.success(f"✅ {service}: Healthy")
+            elif isinstance(status, int):
+                st.error(f"❌ {service}: Unhealthy")
+            else:
+                st.error(f"❌ {service}: Unreachable ({status})")
+
+
+# Service Status (fragments write to the sidebar via its context manager)
+with st.sidebar:
+    render_service_status()
 
 st.sidebar.markdown("---")
 
-# Action buttons
-col1, col2 = st.sidebar.columns(2)
-with col1:
-    fetch_data_btn = st.button("Fetch Data", use_container_width=True, disabled=(ticker is None))
-with col2:
-    run_strategy_btn = st.button("Run Strategy", use_container_width=True, disabled=(ticker is None))
+# Fetch Data only needs the ticker and dates, so it stays outside the parameters form
+fetch_data_btn = st.sidebar.button("Fetch Data", use_container_width=True, disabled=(ticker is None))
 
 # Main content area
 tab1, tab2, tab3, tab4 = st.tabs(["Overview", "Advanced Analytics", "Detailed Results", "History"])
 
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def fetch_market_data(ticker, start_date, end_date, _correlation_id):
+    """
+    /data/fetch response for a ticker and ISO date range, reused for an hour.
+    
+    Repeat fetches of the same range skip the data service; the correlation
+    ID is left out of the cache key. Errors raise HTTPError and aren't cached.
+    """
+    response = get_http().post(
+        f'{DATA_SERVICE_URL}/data/fetch',
+        data=_dumps({
+            'ticker': ticker,
+            'start_date': start_date,
+            'end_date': end_date
+        }),
+        headers={**JSON_HEADERS, 'X-Correlation-ID': _correlation_id},
+        timeout=30
+    )
+    
+    if response.status_code != 200:
+        error_msg = _loads(response.content).get('error', 'Unknown error')
+        raise requests.exceptions.HTTPError(error_msg, response=response)
+    
+    return _loads(response.content)
+
+
+@st.cache_data(ttl=60, show_spinner="Loading history...")
+def fetch_history(strategy_service_url):
+    """Raw /results response body, shared across reruns and sessions for 60 seconds"""
+    response = get_http().get(f'{strategy_service_url}/results', timeout=10)
+    response.raise_for_status()
+    return response.content
+
+
 # Fetch Data
 if fetch_data_btn:
     if not ticker:
@@ -341,33 +486,25 @@ if fetch_data_btn:
                     'correlation_id': correlation_id
                 })
                 
-                response = requests.post(
-                    f'{DATA_SERVICE_URL}/data/fetch',
-                    json={
-                        'ticker': ticker,
-                        'start_date': start_date.strftime('%Y-%m-%d'),
-                        'end_date': end_date.strftime('%Y-%m-%d')
-                    },
-                    headers={'X-Correlation-ID': correlation_id},
-                    timeout=30
+                result = fetch_market_data(
+                    ticker,
+                    start_date.strftime('%Y-%m-%d'),
+                    end_date.strftime('%Y-%m-%d'),
+                    correlation_id
                 )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.info("Data fetched successfully", extra={
-                        'ticker': ticker,
-                        'records': result['records'],
-                        'correlation_id': correlation_id
-                    })
-                    st.sidebar.success(f"Fetched {result['records']} records for {ticker}")
-                else:
-                    error_msg = response.json().get('error', 'Unknown error')
-                    logger.error("Failed to fetch data", extra={
-                        'ticker': ticker,
-                        'status_code': response.status_code,
-                        'error': error_msg
-                    })
-                    st.sidebar.error(f"Error: {error_msg}")
+                logger.info("Data fetched successfully", extra={
+                    'ticker': ticker,
+                    'records': result['records'],
+                    'correlation_id': correlation_id
+                })
+                st.sidebar.success(f"Fetched {result['records']} records for {ticker}")
+            except requests.exceptions.HTTPError as e:
+                logger.error("Failed to fetch data", extra={
+                    'ticker': ticker,
+                    'status_code': e.response.status_code,
+                    'error': str(e)
+                })
+                st.sidebar.error(f"Error: {str(e)}")
             except Exception as e:
                 logger.error("Connection error while fetching data", extra={
                     'ticker': ticker,
@@ -379,71 +516,226 @@ if fetch_data_btn:
 if run_strategy_btn:
     if not ticker:
         st.sidebar.error("Please select a stock ticker first!")
+    # Validate date range before anything is sent to the backend
+    elif start_date >= end_date:
+        st.sidebar.error("Start date must be before end date!")
     else:
-        # Validate date range
-        if start_date >= end_date:
-            st.sidebar.error("Start date must be before end date!")
-        else:
-            with st.spinner("Running strategy and backtesting..."):
-                try:
-                    correlation_id = set_correlation_id()
-                    logger.info("Running strategy", extra={
+        with st.spinner("Running strategy and backtesting..."):
+            try:
+                correlation_id = set_correlation_id()
+                logger.info("Running strategy", extra={
+                    'ticker': ticker,
+                    'strategy': strategy,
+                    'start_date': start_date.strftime('%Y-%m-%d'),
+                    'end_date': end_date.strftime('%Y-%m-%d'),
+                    'initial_capital': initial_capital,
+                    'correlation_id': correlation_id
+                })
+                
+                response = get_http().post(
+                    f'{STRATEGY_SERVICE_URL}/strategy/run',
+                    data=_dumps({
                         'ticker': ticker,
                         'strategy': strategy,
                         'start_date': start_date.strftime('%Y-%m-%d'),
                         'end_date': end_date.strftime('%Y-%m-%d'),
+                        'parameters': parameters,
                         'initial_capital': initial_capital,
+                        'enable_risk_management': enable_risk_mgmt,
+                        'use_kelly': use_kelly,
+                        'enable_stop_loss': enable_stop_loss,
+                        'stop_loss_pct': stop_loss_pct,
+                        'commission': commission,
+                        'slippage': slippage,
+                        'max_position_pct': max_position_pct
+                    }),
+                    headers={**JSON_HEADERS, 'X-Correlation-ID': correlation_id},
+                    timeout=60
+                )
+                
+                if response.status_code == 200:
+                    result = _loads(response.content)
+                    st.session_state['backtest_result'] = result
+                    # Per-result caches are shared by every session in this process; the
+                    # run's UUID can't collide the way a reset database's ids could
+                    st.session_state['backtest_key'] = correlation_id
+                    # The new backtest should show up on the next history refresh
+                    fetch_history.clear()
+                    logger.info("Strategy executed successfully", extra={
+                        'ticker': ticker,
+                        'strategy': strategy,
+                        'backtest_id': result.get('backtest_id'),
+                        'total_return': result['metrics']['total_return'],
                         'correlation_id': correlation_id
                     })
-                    
-                    response = requests.post(
-                        f'{STRATEGY_SERVICE_URL}/strategy/run',
-                        json={
-                            'ticker': ticker,
-                            'strategy': strategy,
-                            'start_date': start_date.strftime('%Y-%m-%d'),
-                            'end_date': end_date.strftime('%Y-%m-%d'),
-                            'parameters': parameters,
-                            'initial_capital': initial_capital,
-                            'enable_risk_management': enable_risk_mgmt,
-                            'use_kelly': use_kelly,
-                            'enable_stop_loss': enable_stop_loss,
-                            'stop_loss_pct': stop_loss_pct,
-                            'commission': commission,
-                            'slippage': slippage,
-                            'max_position_pct': max_position_pct
-                        },
-                        headers={'X-Correlation-ID': correlation_id},
-                        timeout=60
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        st.session_state['backtest_result'] = result
-                        logger.info("Strategy executed successfully", extra={
-                            'ticker': ticker,
-                            'strategy': strategy,
-                            'backtest_id': result.get('backtest_id'),
-                            'total_return': result['metrics']['total_return'],
-                            'correlation_id': correlation_id
-                        })
-                        st.sidebar.success("Strategy executed successfully!")
-                    else:
-                        error_msg = response.json().get('error', 'Unknown error')
-                        logger.error("Failed to run strategy", extra={
-                            'ticker': ticker,
-                            'strategy': strategy,
-                            'status_code': response.status_code,
-                            'error': error_msg
-                        })
-                        st.sidebar.error(f"Error: {error_msg}")
-                except Exception as e:
-                    logger.error("Connection error while running strategy", extra={
+                    st.sidebar.success("Strategy executed successfully!")
+                else:
+                    error_msg = _loads(response.content).get('error', 'Unknown error')
+                    logger.error("Failed to run strategy", extra={
                         'ticker': ticker,
                         'strategy': strategy,
-                        'error': str(e)
-                    }, exc_info=True)
-                    st.sidebar.error(f"Connection error: {str(e)}")
+                        'status_code': response.status_code,
+                        'error': error_msg
+                    })
+                    st.sidebar.error(f"Error: {error_msg}")
+            except Exception as e:
+                logger.error("Connection error while running strategy", extra={
+                    'ticker': ticker,
+                    'strategy': strategy,
+                    'error': str(e)
+                }, exc_info=True)
+                st.sidebar.error(f"Connection error: {str(e)}")
+
+# Flask's JSON provider sends the engine's timestamps as HTTP dates; parsing
+# with the exact format avoids pandas inferring the format value by value
+BACKEND_DATE_FORMAT = '%a, %d %b %Y %H:%M:%S GMT'
+
+
+def parse_backend_dates(dates):
+    """
+    Parse backend date values, fast path first.
+    
+    Dates that don't match BACKEND_DATE_FORMAT (ISO strings, a changed JSON
+    provider) fall back to per-value parsing; unparseable values become NaT
+    rather than failing the whole tab.
+    """
+    import pandas as pd
+    
+    try:
+        return pd.to_datetime(dates, format=BACKEND_DATE_FORMAT)
+    except (ValueError, TypeError):
+        return pd.to_datetime(dates, format='mixed', errors='coerce')
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def prepare_signals(backtest_key, _signals):
+    """
+    Signals frame with parsed dates, plus its BUY, SELL and non-HOLD subsets.
+    
+    Cached per backtest so reruns skip the frame build, date parsing and
+    signal filtering; the raw signals list is identified by backtest_key.
+    Each call returns fresh copies, so callers may add columns freely.
+    """
+    import pandas as pd
+    
+    signals_df = pd.DataFrame(_signals)
+    signals_df['date'] = parse_backend_dates(signals_df['date'])
+    # Prices only feed charts and display returns, so float32 is plenty and
+    # halves the plotted payload
+    signals_df['close'] = signals_df['close'].astype(np.float32)
+    
+    # Fixed categories give known int8 codes (HOLD=0, BUY=1, SELL=2), so all
+    # three subsets come from integer masks instead of string comparisons
+    signals_df['signal'] = signals_df['signal'].astype(pd.CategoricalDtype(['HOLD', 'BUY', 'SELL']))
+    codes = signals_df['signal'].cat.codes.to_numpy()
+    
+    buy_signals = signals_df.iloc[codes == 1]
+    sell_signals = signals_df.iloc[codes == 2]
+    trade_signals = signals_df.iloc[codes != 0]
+    
+    return signals_df, buy_signals, sell_signals, trade_signals
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def prepare_trades(backtest_key, _trades):
+    """
+    Trades frame with parsed dates, shared by the analytics and details tabs.
+    
+    Cached per backtest; the raw trades list is identified by backtest_key.
+    """
+    import pandas as pd
+    
+    trades_df = pd.DataFrame(_trades)
+    trades_df['date'] = parse_backend_dates(trades_df['date'])
+    return trades_df
+
+
+def lttb_indices(values, threshold):
+    """
+    Indices of the points Largest-Triangle-Three-Buckets keeps when reducing
+    a series plotted against its position to threshold points.
+    
+    The first and last points are always kept; each bucket in between keeps
+    the point forming the largest triangle with the previously kept point
+    and the average of the next bucket, which preserves peaks and troughs.
+    """
+    n = values.size
+    if threshold < 3 or n <= threshold:
+        return np.arange(n)
+    
+    values = values.astype(np.float64)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    
+    prev = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < edges.size:
+            next_x = (edges[i + 1] + edges[i + 2] - 1) / 2
+            next_y = values[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            next_x, next_y = n - 1, values[-1]
+        
+        bucket_x = np.arange(start, end)
+        areas = np.abs(
+            (prev - next_x) * (values[start:end] - values[prev])
+            - (prev - bucket_x) * (next_y - values[prev])
+        )
+        prev = start + int(areas.argmax())
+        kept[i + 1] = prev
+    
+    return kept
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_equity_chart(backtest_key, _equity_curve, initial_capital, downsample):
+    """
+    Portfolio value chart for one backtest against an initial capital line.
+    
+    Cached per backtest, capital and downsampling choice so reruns reuse the
+    figure; the raw equity curve is identified by backtest_key.
+    """
+    import plotly.graph_objects as go
+    
+    # Plain arrays straight to plotly; float32 halves the payload sent to the browser
+    equity_values = np.asarray(_equity_curve, dtype=np.float32)
+    trading_days = np.arange(equity_values.size, dtype=np.int32)
+    
+    if downsample and equity_values.size > MAX_PLOT_POINTS:
+        kept = lttb_indices(equity_values, MAX_PLOT_POINTS)
+        equity_values, trading_days = equity_values[kept], trading_days[kept]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=trading_days,
+        y=equity_values,
+        mode='lines',
+        name='Portfolio Value',
+        line=dict(color='#1f77b4', width=2),
+        fill='tonexty',
+        fillcolor='rgba(31, 119, 180, 0.1)'
+    ))
+    
+    fig.add_hline(
+        y=initial_capital,
+        line_dash="dash",
+        line_color="red",
+        annotation_text="Initial Capital",
+        line_width=2
+    )
+    
+    fig.update_layout(
+        title="Portfolio Value Over Time",
+        xaxis_title="Trading Days",
+        yaxis_title="Portfolio Value ($)",
+        hovermode='x unified',
+        height=400,
+        template="plotly_white"
+    )
+    
+    return fig
+
 
 # Dashboard Tab
 with tab1:
@@ -478,6 +770,10 @@ with tab1:
         6. **View results** including metrics, charts, and signals
         """)
     elif 'backtest_result' in st.session_state:
+        # plotly is imported once there is a result to show, so the first
+        # paint of a fresh dashboard doesn't wait on it
+        import plotly.graph_objects as go
+        
         result = st.session_state['backtest_result']
         metrics = result['metrics']
         
@@ -672,41 +968,13 @@ with tab1:
         # Equity Curve
         st.subheader("Equity Curve")
         
-        equity_df = pd.DataFrame({
-            'Day': range(len(result['equity_curve'])),
-            'Portfolio Value': result['equity_curve']
-        })
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=equity_df['Day'],
-            y=equity_df['Portfolio Value'],
-            mode='lines',
-            name='Portfolio Value',
-            line=dict(color='#1f77b4', width=2),
-            fill='tonexty',
-            fillcolor='rgba(31, 119, 180, 0.1)'
-        ))
-        
-        fig.add_hline(
-            y=initial_capital,
-            line_dash="dash",
-            line_color="red",
-            annotation_text="Initial Capital",
-            line_width=2
-        )
-        
-        fig.update_layout(
-            title="Portfolio Value Over Time",
-            xaxis_title="Trading Days",
-            yaxis_title="Portfolio Value ($)",
-            hovermode='x unified',
-            height=400,
-            template="plotly_white"
+        st.plotly_chart(
+            build_equity_chart(
+                st.session_state.get('backtest_key'), result['equity_curve'], initial_capital, downsample_plots
+            ),
+            use_container_width=True
         )
         
-        st.plotly_chart(fig, use_container_width=True)
-        
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Drawdown Chart
@@ -718,8 +986,8 @@ with tab1:
         
         fig_dd = go.Figure()
         fig_dd.add_trace(go.Scatter(
-            x=list(range(len(drawdown))),
-            y=drawdown,
+            x=np.arange(drawdown.size, dtype=np.int32),
+            y=drawdown.astype(np.float32),
             mode='lines',
             name='Drawdown',
             line=dict(color='red', width=2),
@@ -751,29 +1019,26 @@ with tab1:
         # Cumulative Returns Comparison (Strategy vs Buy-and-Hold)
         st.subheader("Strategy vs Buy-and-Hold Comparison")
         
-        signals_df = pd.DataFrame(result['signals'])
-        if not signals_df.empty and 'close' in signals_df.columns:
-            # Calculate buy-and-hold returns
-            initial_price = signals_df['close'].iloc[0]
-            buy_hold_values = (signals_df['close'] / initial_price) * initial_capital
-            
-            # Calculate strategy returns
-            strategy_returns = [(val / initial_capital - 1) * 100 for val in result['equity_curve']]
-            buy_hold_returns = [(val / initial_capital - 1) * 100 for val in buy_hold_values]
+        signals_df, _, _, _ = prepare_signals(st.session_state.get('backtest_key'), result['signals'])
+        if not signals_df.empty:
+            # Buy-and-hold and strategy returns as whole-array operations
+            close_prices = signals_df['close'].to_numpy()
+            buy_hold_returns = (close_prices / close_prices[0] - 1) * 100
+            strategy_returns = (np.asarray(result['equity_curve']) / initial_capital - 1) * 100
             
             fig_comp = go.Figure()
             
             fig_comp.add_trace(go.Scatter(
-                x=list(range(len(strategy_returns))),
-                y=strategy_returns,
+                x=np.arange(strategy_returns.size, dtype=np.int32),
+                y=strategy_returns.astype(np.float32),
                 mode='lines',
                 name='Strategy',
                 line=dict(color='#1f77b4', width=2)
             ))
             
             fig_comp.add_trace(go.Scatter(
-                x=list(range(len(buy_hold_returns))),
-                y=buy_hold_returns,
+                x=np.arange(buy_hold_returns.size, dtype=np.int32),
+                y=buy_hold_returns.astype(np.float32),
                 mode='lines',
                 name='Buy & Hold',
                 line=dict(color='orange', width=2, dash='dash')
@@ -794,10 +1059,10 @@ with tab1:
             # Show comparison metrics
             col1, col2, col3 = st.columns(3)
             with col1:
-                strategy_final = strategy_returns[-1] if strategy_returns else 0
+                strategy_final = strategy_returns[-1] if strategy_returns.size else 0
                 st.metric("Strategy Return", f"{strategy_final:.2f}%")
             with col2:
-                buy_hold_final = buy_hold_returns[-1] if buy_hold_returns else 0
+                buy_hold_final = buy_hold_returns[-1] if buy_hold_returns.size else 0
                 st.metric("Buy & Hold Return", f"{buy_hold_final:.2f}%")
             with col3:
                 outperformance = strategy_final - buy_hold_final
@@ -814,10 +1079,15 @@ with tab2:
     st.header("Advanced Analytics")
     
     if 'backtest_result' in st.session_state:
+        import pandas as pd
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         result = st.session_state['backtest_result']
         metrics = result['metrics']
-        signals_df = pd.DataFrame(result['signals'])
-        signals_df['date'] = pd.to_datetime(signals_df['date'])
+        signals_df, buy_signals, sell_signals, _ = prepare_signals(
+            st.session_state.get('backtest_key'), result['signals']
+        )
         
         # Strategy Indicator Visualization
         st.subheader("Strategy Indicators")
@@ -861,7 +1131,6 @@ with tab2:
             ))
             
             # Buy signals
-            buy_signals = signals_df[signals_df['signal'] == 'BUY']
             if not buy_signals.empty:
                 fig_ind.add_trace(go.Scatter(
                     x=buy_signals['date'],
@@ -872,7 +1141,6 @@ with tab2:
                 ))
             
             # Sell signals
-            sell_signals = signals_df[signals_df['signal'] == 'SELL']
             if not sell_signals.empty:
                 fig_ind.add_trace(go.Scatter(
                     x=sell_signals['date'],
@@ -943,7 +1211,6 @@ with tab2:
             ))
             
             # Buy signals
-            buy_signals = signals_df[signals_df['signal'] == 'BUY']
             if not buy_signals.empty:
                 fig_ind.add_trace(go.Scatter(
                     x=buy_signals['date'],
@@ -954,7 +1221,6 @@ with tab2:
                 ))
             
             # Sell signals
-            sell_signals = signals_df[signals_df['signal'] == 'SELL']
             if not sell_signals.empty:
                 fig_ind.add_trace(go.Scatter(
                     x=sell_signals['date'],
@@ -1002,7 +1268,6 @@ with tab2:
             ), row=1, col=1)
             
             # Buy signals
-            buy_signals = signals_df[signals_df['signal'] == 'BUY']
             if not buy_signals.empty:
                 fig_ind.add_trace(go.Scatter(
                     x=buy_signals['date'],
@@ -1013,7 +1278,6 @@ with tab2:
                 ), row=1, col=1)
             
             # Sell signals
-            sell_signals = signals_df[signals_df['signal'] == 'SELL']
             if not sell_signals.empty:
                 fig_ind.add_trace(go.Scatter(
                     x=sell_signals['date'],
@@ -1164,32 +1428,31 @@ with tab2:
         if result.get('trades'):
             st.subheader("Trade Analysis")
             
-            trades_df = pd.DataFrame(result['trades'])
+            trades_df = prepare_trades(st.session_state.get('backtest_key'), result['trades'])
             
             # Filter for completed trades (Buy-Sell pairs)
-            buy_trades = trades_df[trades_df['signal'].isin(['BUY'])].copy()
-            sell_trades = trades_df[trades_df['signal'].isin(['SELL', 'STOP_LOSS'])].copy()
+            buy_trades = trades_df[trades_df['signal'] == 'BUY']
+            sell_trades = trades_df[trades_df['signal'].isin(['SELL', 'STOP_LOSS'])]
             
             if not buy_trades.empty and not sell_trades.empty:
-                # Calculate trade durations and PnL
-                trade_analysis = []
-                for i in range(min(len(buy_trades), len(sell_trades))):
-                    buy_trade = buy_trades.iloc[i]
-                    sell_trade = sell_trades.iloc[i]
-                    
-                    duration = (pd.to_datetime(sell_trade['date']) - pd.to_datetime(buy_trade['date'])).days
-                    pnl = sell_trade.get('pnl', 0)
-                    
-                    trade_analysis.append({
-                        'duration': duration,
-                        'pnl': pnl,
-                        'is_win': pnl > 0,
-                        'entry_date': buy_trade['date'],
-                        'exit_date': sell_trade['date']
-                    })
+                # Pair the nth entry with the nth exit; durations and PnL per pair
+                pairs = min(len(buy_trades), len(sell_trades))
+                entry_dates = buy_trades['date'].iloc[:pairs].reset_index(drop=True)
+                exit_dates = sell_trades['date'].iloc[:pairs].reset_index(drop=True)
+                if 'pnl' in sell_trades.columns:
+                    pnl = sell_trades['pnl'].iloc[:pairs].reset_index(drop=True)
+                else:
+                    pnl = pd.Series(0.0, index=range(pairs))
+                
+                trade_df = pd.DataFrame({
+                    'duration': (exit_dates - entry_dates).dt.days,
+                    'pnl': pnl,
+                    'is_win': pnl > 0,
+                    'entry_date': entry_dates,
+                    'exit_date': exit_dates
+                })
                 
-                if trade_analysis:
-                    trade_df = pd.DataFrame(trade_analysis)
+                if not trade_df.empty:
                     
                     col1, col2 = st.columns(2)
                     
@@ -1270,11 +1533,120 @@ with tab2:
     else:
         st.info("Run a strategy first to see advanced analytics.")
 
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_signals_chart(backtest_key, _signals, chart_ticker):
+    """
+    Price chart with buy/sell markers for one backtest, drawn with WebGL
+    so multi-year series stay responsive.
+    
+    Cached per backtest so reruns reuse the figure instead of rebuilding
+    every trace; the raw signals list is identified by backtest_key.
+    """
+    import plotly.graph_objects as go
+    
+    signals_df, buy_signals, sell_signals, _ = prepare_signals(backtest_key, _signals)
+    
+    fig = go.Figure()
+    
+    # Price line
+    fig.add_trace(go.Scattergl(
+        x=signals_df['date'],
+        y=signals_df['close'],
+        mode='lines',
+        name='Close Price',
+        line=dict(color='blue', width=1)
+    ))
+    
+    # Buy signals
+    if not buy_signals.empty:
+        fig.add_trace(go.Scattergl(
+            x=buy_signals['date'],
+            y=buy_signals['close'],
+            mode='markers',
+            name='Buy Signal',
+            marker=dict(color='green', size=10, symbol='triangle-up')
+        ))
+    
+    # Sell signals
+    if not sell_signals.empty:
+        fig.add_trace(go.Scattergl(
+            x=sell_signals['date'],
+            y=sell_signals['close'],
+            mode='markers',
+            name='Sell Signal',
+            marker=dict(color='red', size=10, symbol='triangle-down')
+        ))
+    
+    fig.update_layout(
+        title=f"{chart_ticker} Price with Trading Signals",
+        xaxis_title="Date",
+        yaxis_title="Price ($)",
+        hovermode='x unified',
+        height=500
+    )
+    
+    return fig
+
+
+@st.fragment
+def render_signals_chart(backtest_key, signals, chart_ticker):
+    """Price chart panel, isolated from the rest of the Detailed Results tab"""
+    st.plotly_chart(
+        build_signals_chart(backtest_key, signals, chart_ticker),
+        use_container_width=True
+    )
+
+
+# Display formats for the trade details table
+TRADE_FORMATS = {
+    'price': '${:.2f}',
+    'effective_price': '${:.2f}',
+    'commission': '${:.2f}',
+    'slippage': '${:.2f}',
+    'portfolio_value': '${:,.2f}',
+    'cost': '${:.2f}',
+    'proceeds': '${:.2f}',
+    'pnl': '${:.2f}'
+}
+
+# Risk-reward columns, shown only when Show Risk-Reward Ratios is on
+RISK_REWARD_FORMATS = {
+    'stop_loss': '${:.2f}',
+    'target_price': '${:.2f}',
+    'risk_reward_ratio': '{:.2f}'
+}
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def format_trades(backtest_key, _trades, show_risk_reward):
+    """
+    Trades table with money and ratio columns already rendered as strings.
+    
+    Cached per backtest and risk-reward toggle, so reruns skip the per-cell
+    formatting; the raw trades list is identified by backtest_key.
+    """
+    trades_df = prepare_trades(backtest_key, _trades)
+    
+    formats = dict(TRADE_FORMATS)
+    if show_risk_reward:
+        formats.update(RISK_REWARD_FORMATS)
+    else:
+        trades_df = trades_df.drop(columns=[col for col in RISK_REWARD_FORMATS if col in trades_df.columns])
+    
+    for col, fmt in formats.items():
+        if col in trades_df.columns:
+            trades_df[col] = trades_df[col].map(fmt.format, na_action='ignore')
+    
+    return trades_df
+
+
 # Detailed Results Tab
 with tab3:
     st.header("Detailed Results")
     
     if 'backtest_result' in st.session_state:
+        import pandas as pd
+        
         result = st.session_state['backtest_result']
         
         # Export functionality
@@ -1290,13 +1662,17 @@ with tab3:
                     'signals': result.get('signals', [])
                 }
                 
-                # Convert to CSV for trades
+                # Convert to CSV for trades with Arrow's C++ writer
                 if result.get('trades'):
-                    trades_df = pd.DataFrame(result['trades'])
-                    csv = trades_df.to_csv(index=False)
+                    import pyarrow as pa
+                    import pyarrow.csv as pa_csv
+                    
+                    trades_table = pa.Table.from_pandas(pd.DataFrame(result['trades']), preserve_index=False)
+                    csv_buffer = pa.BufferOutputStream()
+                    pa_csv.write_csv(trades_table, csv_buffer)
                     st.download_button(
                         label="Download Trades CSV",
-                        data=csv,
+                        data=csv_buffer.getvalue().to_pybytes(),
                         file_name=f"{result['ticker']}_{result['strategy']}_trades.csv",
                         mime="text/csv"
                     )
@@ -1304,11 +1680,10 @@ with tab3:
         # Trading Signals
         st.subheader("Trading Signals")
         
-        signals_df = pd.DataFrame(result['signals'])
-        signals_df['date'] = pd.to_datetime(signals_df['date'])
-        
-        # Filter only actual trade signals (not HOLD)
-        trade_signals = signals_df[signals_df['signal'] != 'HOLD'].copy()
+        # Only actual trade signals (not HOLD)
+        _, _, _, trade_signals = prepare_signals(
+            st.session_state.get('backtest_key'), result['signals']
+        )
         
         if not trade_signals.empty:
             st.dataframe(
@@ -1323,55 +1698,15 @@ with tab3:
         # Price Chart with Signals
         st.subheader("Price Chart with Trading Signals")
         
-        fig = go.Figure()
-        
-        # Price line
-        fig.add_trace(go.Scatter(
-            x=signals_df['date'],
-            y=signals_df['close'],
-            mode='lines',
-            name='Close Price',
-            line=dict(color='blue', width=1)
-        ))
-        
-        # Buy signals
-        buy_signals = signals_df[signals_df['signal'] == 'BUY']
-        if not buy_signals.empty:
-            fig.add_trace(go.Scatter(
-                x=buy_signals['date'],
-                y=buy_signals['close'],
-                mode='markers',
-                name='Buy Signal',
-                marker=dict(color='green', size=10, symbol='triangle-up')
-            ))
-        
-        # Sell signals
-        sell_signals = signals_df[signals_df['signal'] == 'SELL']
-        if not sell_signals.empty:
-            fig.add_trace(go.Scatter(
-                x=sell_signals['date'],
-                y=sell_signals['close'],
-                mode='markers',
-                name='Sell Signal',
-                marker=dict(color='red', size=10, symbol='triangle-down')
-            ))
-        
-        fig.update_layout(
-            title=f"{ticker} Price with Trading Signals",
-            xaxis_title="Date",
-            yaxis_title="Price ($)",
-            hovermode='x unified',
-            height=500
+        render_signals_chart(
+            st.session_state.get('backtest_key'), result['signals'], result.get('ticker', ticker)
         )
         
-        st.plotly_chart(fig, use_container_width=True)
-        
         # Trade Details
         st.subheader("Trade Details")
         
         if result['trades']:
-            trades_df = pd.DataFrame(result['trades'])
-            trades_df['date'] = pd.to_datetime(trades_df['date'], errors='coerce')
+            trades_df = prepare_trades(st.session_state.get('backtest_key'), result['trades'])
             
             # Add calculated columns if they exist
             if 'commission' in trades_df.columns:
@@ -1387,40 +1722,9 @@ with tab3:
                     avg_rr = buy_trades['risk_reward_ratio'].mean()
                     st.info(f"Average Risk-Reward Ratio: {avg_rr:.2f}:1 (Higher is better)")
             
-            # Format columns for display
-            format_dict = {
-                'price': '${:.2f}',
-                'effective_price': '${:.2f}',
-                'commission': '${:.2f}',
-                'slippage': '${:.2f}',
-                'portfolio_value': '${:,.2f}'
-            }
-            
-            # Add conditional formatting for specific columns
-            if 'cost' in trades_df.columns:
-                format_dict['cost'] = '${:.2f}'
-            if 'proceeds' in trades_df.columns:
-                format_dict['proceeds'] = '${:.2f}'
-            if 'pnl' in trades_df.columns:
-                format_dict['pnl'] = '${:.2f}'
-            
-            # Conditionally show/hide risk-reward related columns
-            if show_risk_reward:
-                # Include R:R columns in display
-                if 'stop_loss' in trades_df.columns:
-                    format_dict['stop_loss'] = '${:.2f}'
-                if 'target_price' in trades_df.columns:
-                    format_dict['target_price'] = '${:.2f}'
-                if 'risk_reward_ratio' in trades_df.columns:
-                    format_dict['risk_reward_ratio'] = '{:.2f}'
-            else:
-                # Hide R:R columns
-                cols_to_drop = ['stop_loss', 'target_price', 'risk_reward_ratio']
-                trades_df = trades_df.drop(columns=[col for col in cols_to_drop if col in trades_df.columns])
-            
-            # Display trades with formatting
+            # Display trades pre-formatted, so no Styler is rebuilt per rerun
             st.dataframe(
-                trades_df.style.format(format_dict),
+                format_trades(st.session_state.get('backtest_key'), result['trades'], show_risk_reward),
                 use_container_width=True
             )
         else:
@@ -1429,23 +1733,53 @@ with tab3:
     else:
         st.info("Run a strategy first to see detailed results.")
 
+# Columns the History tab displays or charts
+HISTORY_COLUMNS = ['id', 'ticker', 'strategy', 'total_return', 'sharpe_ratio', 'max_drawdown', 'created_at']
+
+
+@st.cache_data(show_spinner=False)
+def history_frame(results_json):
+    """
+    Backtest history as a DataFrame of just the displayed columns.
+    
+    Keyed on the raw /results response body, so reruns reuse the frame
+    until the history is refreshed.
+    """
+    import pandas as pd
+    
+    rows = _loads(results_json)['results']
+    columns = [col for col in HISTORY_COLUMNS if rows and col in rows[0]]
+    return pd.DataFrame.from_records(rows, columns=columns)
+
+
 # History Tab
 with tab4:
     st.header("Backtest History")
     
     col1, col2 = st.columns([3, 1])
     with col2:
-        if st.button("Refresh History", use_container_width=True):
-            try:
-                response = requests.get(f'{STRATEGY_SERVICE_URL}/results', timeout=10)
-                if response.status_code == 200:
-                    st.session_state['history'] = response.json()['results']
-                    st.success("History refreshed!")
-            except Exception as e:
-                st.error(f"Error fetching history: {str(e)}")
+        refresh_history = st.button("Refresh History", use_container_width=True)
+        force_refresh = st.checkbox(
+            "Force refresh",
+            help="Bypass the 60 second history cache to pick up runs from other sessions"
+        )
+        if refresh_history:
+            # A plain refresh is served from the cache while it's fresh
+            if force_refresh:
+                fetch_history.clear()
+            st.session_state['history_loaded'] = True
+    
+    history_json = None
+    if st.session_state.get('history_loaded'):
+        try:
+            history_json = fetch_history(STRATEGY_SERVICE_URL)
+            if refresh_history:
+                col2.success("History refreshed!")
+        except Exception as e:
+            col2.error(f"Error fetching history: {str(e)}")
     
-    if 'history' in st.session_state:
-        history_df = pd.DataFrame(st.session_state['history'])
+    if history_json is not None:
+        history_df = history_frame(history_json)
         
         if not history_df.empty:
             # Add some metrics at the top
@@ -1476,6 +1810,8 @@ with tab4:
             
             # Performance comparison chart
             if len(history_df) > 1 and 'total_return' in history_df.columns:
+                import plotly.graph_objects as go
+                
                 st.markdown("<br>", unsafe_allow_html=True)
                 st.subheader("Performance Comparison")
                 
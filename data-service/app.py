@@ -109,20 +109,21 @@ from common.metrics import (
     track_request_metrics,
     data_fetch_total,
     data_quality_score,
-    rate_limit_hits_total
+    rate_limit_hits_total,
+    ticker_label
 )
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
-initialize_service_metrics('data-service', version='1.0.0')
+initialize_service_metrics('data-service', version='1.0.0', endpoints=['/data/fetch'])
 
 # Initialize rate limiter and request queue
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 
 try:
-    from common.rate_limiter import RateLimiter, rate_limit
+    from common.rate_limiter import init_rate_limiter, rate_limit
     from request_queue import RequestQueue, RequestPriority
     
-    app.rate_limiter = RateLimiter(REDIS_URL)
+    init_rate_limiter(app, REDIS_URL)
     request_queue = RequestQueue(REDIS_URL, max_retries=3, retry_delay=5)
     
     logger.info("Rate limiter and request queue initialized", extra={
@@ -244,7 +245,7 @@ def _fetch_yahoo_finance_data(ticker: str, start_date: str, end_date: str) -> pd
 
 
 @app.route('/data/fetch', methods=['POST'])
-@rate_limit(calls=48, period=60, resource='yfinance')  # Yahoo Finance rate limit
+@rate_limit(calls=48, period=60, resource='yfinance', limiter=app.rate_limiter)  # Yahoo Finance rate limit
 @handle_errors
 @log_execution_time(logger)
 @track_request_metrics('data-service', '/data/fetch')
@@ -264,7 +265,7 @@ def fetch_data():
     # Apply rate limiting manually (since decorator needs Flask app context)
     if app.rate_limiter and app.rate_limiter.enabled:
         identifier = request.remote_addr or 'unknown'
-        allowed, info = app.rate_limiter.check_rate_limit(
+        result = app.rate_limiter.check_rate_limit(
             resource='yfinance',
             identifier=identifier,
             calls=48,      # 48 requests per minute
@@ -272,10 +273,10 @@ def fetch_data():
             burst=10       # Burst capacity of 10
         )
         
-        if not allowed:
+        if not result.allowed:
             logger.warning("Rate limit exceeded", extra={
                 'identifier': identifier,
-                'retry_after': info['retry_after']
+                'retry_after': result.retry_after
             })
             
             # Track rate limit hit in metrics
@@ -287,7 +288,7 @@ def fetch_data():
             response = jsonify({
                 'error': 'RATE_LIMIT_EXCEEDED',
                 'message': 'Rate limit exceeded for yfinance API',
-                'retry_after': info['retry_after'],
+                'retry_after': result.retry_after,
                 'limit': {
                     'calls': 48,
                     'period': 60,
@@ -295,10 +296,10 @@ def fetch_data():
                 }
             })
             response.status_code = 429
-            response.headers['Retry-After'] = str(info['retry_after'])
+            response.headers['Retry-After'] = str(result.retry_after)
             response.headers['X-RateLimit-Limit'] = '48'
-            response.headers['X-RateLimit-Remaining'] = str(info['tokens_remaining'])
-            response.headers['X-RateLimit-Reset'] = str(info['reset_time'])
+            response.headers['X-RateLimit-Remaining'] = str(result.tokens_remaining)
+            response.headers['X-RateLimit-Reset'] = str(result.reset_time)
             return response
     
     # Set correlation ID for request tracing
@@ -377,12 +378,13 @@ def fetch_data():
         
         # Track data quality score in metrics
         quality_score = quality_report.stats.get('quality_score', 0)
-        data_quality_score.labels(ticker=ticker).set(quality_score)
+        metric_ticker = ticker_label(ticker)
+        data_quality_score.labels(ticker=metric_ticker).set(quality_score)
         
         # Track successful data fetch
         data_fetch_total.labels(
             service='data-service',
-            ticker=ticker,
+            ticker=metric_ticker,
             status='success'
         ).inc()
         
@@ -18,7 +18,7 @@ import requests
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from common.logger import get_logger, set_correlation_id, log_execution_time
 from common.health import HealthCheck
-from common.rate_limiter import RateLimiter, rate_limit
+from common.rate_limiter import init_rate_limiter, rate_limit
 from common.metrics import (
     initialize_service_metrics,
     service_up,
@@ -27,7 +27,8 @@ from common.metrics import (
     track_strategy_execution,
     backtest_trades_total,
     backtest_return_percent,
-    backtest_sharpe_ratio
+    backtest_sharpe_ratio,
+    ticker_label
 )
 from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from risk_manager import RiskManager, Portfolio, TransactionCosts
@@ -648,8 +649,7 @@ health_checker = HealthCheck(
 # Initialize rate limiter
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 try:
-    rate_limiter = RateLimiter(redis_url=REDIS_URL)
-    app.rate_limiter = rate_limiter
+    init_rate_limiter(app, REDIS_URL)
     logger.info("Rate limiter initialized")
 except Exception as e:
     logger.warning("Failed to initialize rate limiter, rate limiting disabled", extra={'error': str(e)})
@@ -745,7 +745,8 @@ def metrics():
 
 
 @app.route('/strategy/run', methods=['POST'])
-@rate_limit(calls=10, period=60, resource='strategy_execution')  # Max 10 strategy runs per minute
+@rate_limit(calls=10, period=60, resource='strategy_execution',
+            limiter=app.rate_limiter)  # Max 10 strategy runs per minute
 @log_execution_time(logger)
 def run_strategy():
     """
@@ -916,19 +917,20 @@ def run_strategy():
         })
         
         # Track backtest metrics in Prometheus
+        metric_ticker = ticker_label(ticker)
         backtest_trades_total.labels(
             strategy=strategy_name,
-            ticker=ticker
+            ticker=metric_ticker
         ).inc(int(backtest_results['total_trades']))
         
         backtest_return_percent.labels(
             strategy=strategy_name,
-            ticker=ticker
+            ticker=metric_ticker
         ).observe(float(backtest_results['total_return']))
         
         backtest_sharpe_ratio.labels(
             strategy=strategy_name,
-            ticker=ticker
+            ticker=metric_ticker
         ).set(float(backtest_results['sharpe_ratio']))
         
         # Store results in database (convert numpy types to Python native types)
@@ -0,0 +1,392 @@
+"""
+Unit tests for the error handling middleware
+"""
+import functools
+import unittest
+import os
+import pickle
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask import Flask
+# Imported eagerly: test_strategies.py replaces the flask module during collection
+import flask.testing  # noqa: F401
+from werkzeug.exceptions import NotFound
+
+from common.error_handlers import (
+    APIError,
+    ValidationError,
+    DataFetchError,
+    RateLimitError,
+    ResourceNotFoundError,
+    handle_errors,
+    register_error_handlers,
+    retry_on_failure,
+    cancel_all_retries,
+    resume_retries,
+    validate_request_data,
+)
+from common.logger import set_correlation_id, clear_correlation_id
+
+
+class TestAPIErrors(unittest.TestCase):
+    """Test cases for custom exception classes"""
+
+    def test_to_dict_basic(self):
+        """Test payload for an error without details"""
+        error = ResourceNotFoundError("Backtest not found")
+        self.assertEqual(error.to_dict(), {
+            'error': 'RESOURCE_NOT_FOUND',
+            'message': 'Backtest not found',
+            'status_code': 404
+        })
+
+    def test_to_dict_with_details(self):
+        """Test payload includes details when present"""
+        error = ValidationError("Invalid ticker", field='ticker')
+        payload = error.to_dict()
+        self.assertEqual(payload['status_code'], 400)
+        self.assertEqual(payload['details'], {'field': 'ticker'})
+
+    def test_to_dict_returns_copy(self):
+        """Test mutating a payload does not affect later calls"""
+        error = RateLimitError(retry_after=30)
+        first = error.to_dict()
+        first['correlation_id'] = 'abc'
+
+        second = error.to_dict()
+        self.assertNotIn('correlation_id', second)
+        self.assertEqual(second['details'], {'retry_after_seconds': 30})
+
+    def test_details_empty_by_default(self):
+        """Test errors without details expose an empty read-only mapping"""
+        error = ValidationError("Bad input")
+        self.assertEqual(len(error.details), 0)
+        with self.assertRaises(TypeError):
+            error.details['field'] = 'ticker'
+        self.assertNotIn('details', error.to_dict())
+
+    def test_details_merges_field(self):
+        """Test subclass fields merge into caller-supplied details"""
+        error = ValidationError("Bad input", field='ticker', details={'value': 'X'})
+        self.assertEqual(error.details, {'value': 'X', 'field': 'ticker'})
+
+    def test_status_code_override(self):
+        """Test explicit status code overrides the class default"""
+        error = APIError("Teapot", status_code=418)
+        self.assertEqual(error.to_dict()['status_code'], 418)
+
+    def test_pickle_roundtrip(self):
+        """Test slotted errors survive pickling with details and overrides"""
+        error = APIError("Teapot", status_code=418, details={'pot': 'tea'})
+        restored = pickle.loads(pickle.dumps(error))
+        self.assertIsInstance(restored, APIError)
+        self.assertEqual(restored.to_dict(), error.to_dict())
+
+        error = RateLimitError("Slow down", retry_after=5)
+        restored = pickle.loads(pickle.dumps(error))
+        self.assertEqual(restored.details, {'retry_after_seconds': 5})
+
+
+class TestHandleErrors(unittest.TestCase):
+    """Test cases for the handle_errors decorator"""
+
+    def setUp(self):
+        """Set up a minimal Flask app"""
+        clear_correlation_id()
+        self.app = Flask(__name__)
+
+    def tearDown(self):
+        """Clean up after tests"""
+        clear_correlation_id()
+
+    def _call(self, func):
+        """Invoke a decorated function inside a request context"""
+        with self.app.test_request_context('/test', method='POST'):
+            response = handle_errors(func)()
+            return response.get_json(), response.status_code
+
+    def test_success_passthrough(self):
+        """Test return values pass through untouched"""
+        @handle_errors
+        def endpoint():
+            return {'result': 'ok'}
+
+        with self.app.test_request_context('/test'):
+            self.assertEqual(endpoint(), {'result': 'ok'})
+
+    def test_preserves_function_metadata(self):
+        """Test Flask can still derive endpoint names from wrapped views"""
+        def fetch_data():
+            """Fetch data"""
+
+        wrapped = handle_errors(fetch_data)
+        self.assertEqual(wrapped.__name__, 'fetch_data')
+        self.assertEqual(wrapped.__doc__, 'Fetch data')
+        self.assertIs(wrapped.__wrapped__, fetch_data)
+
+    def test_idempotent(self):
+        """Test re-applying the decorator doesn't add another wrapper"""
+        def endpoint():
+            return {'result': 'ok'}
+
+        wrapped = handle_errors(endpoint)
+        self.assertIs(handle_errors(wrapped), wrapped)
+
+        # Wrappers copied from a handled function by other decorators still get wrapped
+        @functools.wraps(wrapped)
+        def outer():
+            raise ValidationError("Raised outside the inner handler")
+
+        self.assertIsNot(handle_errors(outer), outer)
+
+    def test_validation_error(self):
+        """Test validation errors map to 400 responses"""
+        def endpoint():
+            raise ValidationError("Invalid ticker", field='ticker')
+
+        body, status = self._call(endpoint)
+        self.assertEqual(status, 400)
+        self.assertEqual(body['error'], 'VALIDATION_ERROR')
+        self.assertEqual(body['details'], {'field': 'ticker'})
+
+    def test_external_error_includes_correlation_id(self):
+        """Test correlation ID set by the endpoint is echoed back"""
+        def endpoint():
+            set_correlation_id('test-correlation-id')
+            raise DataFetchError("Upstream failed", source='Yahoo Finance')
+
+        body, status = self._call(endpoint)
+        self.assertEqual(status, 503)
+        self.assertEqual(body['correlation_id'], 'test-correlation-id')
+
+    def test_http_exception(self):
+        """Test Werkzeug HTTP exceptions keep their status code"""
+        def endpoint():
+            raise NotFound()
+
+        body, status = self._call(endpoint)
+        self.assertEqual(status, 404)
+        self.assertEqual(body['error'], 'HTTP_ERROR')
+
+        set_correlation_id('test-correlation-id')
+        body, status = self._call(endpoint)
+        self.assertEqual(body['error'], 'HTTP_ERROR')
+        self.assertEqual(body['correlation_id'], 'test-correlation-id')
+
+    def test_subclass_uses_closest_policy(self):
+        """Test subclasses of custom errors resolve through the MRO"""
+        class TickerNotFoundError(ResourceNotFoundError):
+            error_type = "TICKER_NOT_FOUND"
+
+        def endpoint():
+            raise TickerNotFoundError("Unknown ticker")
+
+        body, status = self._call(endpoint)
+        self.assertEqual(status, 404)
+        self.assertEqual(body['error'], 'TICKER_NOT_FOUND')
+
+    def test_upstream_error_traceback_only_at_debug(self):
+        """Test retryable upstream errors skip tracebacks above DEBUG"""
+        def endpoint():
+            raise DataFetchError("Upstream failed")
+
+        with self.assertLogs('common.error_handlers', level='INFO') as logs:
+            self._call(endpoint)
+        self.assertFalse(logs.records[0].exc_info)
+
+        with self.assertLogs('common.error_handlers', level='DEBUG') as logs:
+            self._call(endpoint)
+        self.assertTrue(logs.records[0].exc_info)
+
+    def test_unexpected_error_hides_details(self):
+        """Test unexpected exceptions return a generic 500"""
+        def endpoint():
+            raise KeyError('secret')
+
+        body, status = self._call(endpoint)
+        self.assertEqual(status, 500)
+        self.assertEqual(body['error'], 'INTERNAL_SERVER_ERROR')
+        self.assertNotIn('secret', body['message'])
+
+
+class TestRegisteredHandlers(unittest.TestCase):
+    """Test cases for app-level error handlers"""
+
+    def setUp(self):
+        """Set up a Flask app with registered handlers"""
+        clear_correlation_id()
+        self.app = Flask(__name__)
+        register_error_handlers(self.app)
+
+        @self.app.route('/items', methods=['GET'])
+        def items():
+            raise ValidationError("Bad query", field='q')
+
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        """Clean up after tests"""
+        clear_correlation_id()
+
+    def test_not_found(self):
+        """Test unknown routes return the JSON 404 payload"""
+        response = self.client.get('/missing')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(response.get_json()['error'], 'NOT_FOUND')
+
+    def test_method_not_allowed(self):
+        """Test wrong methods return the JSON 405 payload"""
+        response = self.client.post('/items')
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(response.get_json()['error'], 'METHOD_NOT_ALLOWED')
+
+    def test_not_found_with_correlation_id(self):
+        """Test the cached 404 body gains the correlation ID"""
+        set_correlation_id('test-correlation-id')
+        body = self.client.get('/missing').get_json()
+        self.assertEqual(body['error'], 'NOT_FOUND')
+        self.assertEqual(body['correlation_id'], 'test-correlation-id')
+
+    def test_api_error(self):
+        """Test uncaught API errors use their own status code"""
+        response = self.client.get('/items')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['details'], {'field': 'q'})
+
+
+class TestRetryOnFailure(unittest.TestCase):
+    """Test cases for the retry decorator"""
+
+    def test_backoff_schedule(self):
+        """Test waits grow exponentially and the last error is re-raised"""
+        waits = []
+
+        @retry_on_failure(max_retries=3, backoff_factor=0.001,
+                          on_retry=lambda attempt, wait, exc: waits.append(wait))
+        def always_fails():
+            raise DataFetchError("Upstream failed")
+
+        with self.assertRaises(DataFetchError):
+            always_fails()
+        self.assertEqual(waits, [1, 0.001, 0.001 ** 2])
+
+    def test_succeeds_after_retry(self):
+        """Test a transient failure is retried until it succeeds"""
+        calls = []
+
+        @retry_on_failure(max_retries=2, backoff_factor=0.001)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 2:
+                raise ConnectionError("reset")
+            return 'ok'
+
+        self.assertEqual(flaky(), 'ok')
+        self.assertEqual(len(calls), 2)
+
+    def test_failed_attempt_frames_are_cleared(self):
+        """Test retried exceptions don't keep the failed attempt's locals alive"""
+        class Payload:
+            pass
+
+        seen = []
+
+        @retry_on_failure(max_retries=1, backoff_factor=0.001,
+                          on_retry=lambda attempt, wait, exc: seen.append(exc))
+        def flaky():
+            payload = Payload()  # noqa: F841
+            if not seen:
+                raise DataFetchError("Upstream failed")
+            return 'ok'
+
+        self.assertEqual(flaky(), 'ok')
+        frame = seen[0].__traceback__.tb_next.tb_frame
+        self.assertNotIn('payload', frame.f_locals)
+
+    def test_cancelled_retries_fail_fast(self):
+        """Test cancel_all_retries skips the backoff wait"""
+        calls = []
+
+        @retry_on_failure(max_retries=3, backoff_factor=60)
+        def always_fails():
+            calls.append(1)
+            raise DataFetchError("Upstream failed")
+
+        cancel_all_retries()
+        try:
+            with self.assertRaises(DataFetchError):
+                always_fails()
+        finally:
+            resume_retries()
+        self.assertEqual(len(calls), 1)
+
+    def test_non_retryable_error_propagates(self):
+        """Test exceptions outside the retry list are not retried"""
+        calls = []
+
+        @retry_on_failure(max_retries=3)
+        def broken():
+            calls.append(1)
+            raise ValueError("bad")
+
+        with self.assertRaises(ValueError):
+            broken()
+        self.assertEqual(len(calls), 1)
+
+
+class TestValidateRequestData(unittest.TestCase):
+    """Test cases for request body validation"""
+
+    REQUIRED = ['ticker', 'start_date', 'end_date']
+
+    def test_valid_data(self):
+        """Test complete request bodies pass"""
+        validate_request_data(
+            {'ticker': 'AAPL', 'start_date': '2023-01-01', 'end_date': '2023-12-31'},
+            required_fields=self.REQUIRED
+        )
+
+    def test_missing_body(self):
+        """Test empty request bodies are rejected"""
+        with self.assertRaises(ValidationError) as ctx:
+            validate_request_data(None, required_fields=self.REQUIRED)
+        self.assertEqual(ctx.exception.message, "Request body is required")
+
+    def test_missing_fields(self):
+        """Test missing fields are reported together"""
+        with self.assertRaises(ValidationError) as ctx:
+            validate_request_data({'ticker': 'AAPL'}, required_fields=self.REQUIRED)
+        self.assertEqual(ctx.exception.details['missing_fields'], ['start_date', 'end_date'])
+
+    def test_missing_takes_precedence_over_empty(self):
+        """Test missing fields are reported before empty ones"""
+        with self.assertRaises(ValidationError) as ctx:
+            validate_request_data(
+                {'ticker': '', 'start_date': '2023-01-01'},
+                required_fields=self.REQUIRED
+            )
+        self.assertEqual(ctx.exception.details['missing_fields'], ['end_date'])
+
+    def test_empty_fields(self):
+        """Test None and empty-string values are rejected"""
+        with self.assertRaises(ValidationError) as ctx:
+            validate_request_data(
+                {'ticker': '', 'start_date': None, 'end_date': '2023-12-31'},
+                required_fields=self.REQUIRED
+            )
+        self.assertEqual(ctx.exception.details['empty_fields'], ['ticker', 'start_date'])
+
+    def test_non_object_body(self):
+        """Test JSON arrays, strings and numbers are rejected as validation errors"""
+        for body in (['ticker'], 'AAPL', 42):
+            with self.assertRaises(ValidationError) as ctx:
+                validate_request_data(body, required_fields=self.REQUIRED)
+            self.assertEqual(ctx.exception.message, "Request body must be a JSON object")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Unit tests for the health check utilities
+"""
+import unittest
+import os
+import sys
+import threading
+import time
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from common.health import HealthCheck
+
+
+class TestHealthCheck(unittest.TestCase):
+    """Test cases for HealthCheck"""
+
+    def setUp(self):
+        """Set up a health checker without external dependencies"""
+        os.environ.pop('DATABASE_URL', None)
+        self.health = HealthCheck(service_name='test-service')
+
+    def test_unconfigured_database_is_skipped(self):
+        """Test missing database URL doesn't fail the check"""
+        result = self.health.check_database()
+        self.assertEqual(result['status'], 'skipped')
+        self.assertTrue(result['healthy'])
+
+    def test_format_uptime(self):
+        """Test uptime formatting omits zero hours and minutes"""
+        self.assertEqual(self.health._format_uptime(5.9), '5s')
+        self.assertEqual(self.health._format_uptime(125), '2m 5s')
+        self.assertEqual(self.health._format_uptime(7205), '2h 5s')
+        self.assertEqual(self.health._format_uptime(8130), '2h 15m 30s')
+
+    def test_database_engine_is_reused(self):
+        """Test repeated probes share one pooled engine"""
+        health = HealthCheck(db_url='postgresql://test/db', service_name='test-service')
+        with mock.patch('common.health.create_engine') as create_engine:
+            self.assertTrue(health.check_database()['healthy'])
+            self.assertTrue(health.check_database()['healthy'])
+
+        create_engine.assert_called_once()
+        health.close()
+        create_engine.return_value.dispose.assert_called_once()
+
+    def test_redis_client_is_reused(self):
+        """Test repeated probes share one Redis connection pool"""
+        health = HealthCheck(redis_url='redis://localhost:6379/0', service_name='test-service')
+        with mock.patch('common.health.redis') as redis:
+            self.assertTrue(health.check_redis()['healthy'])
+            self.assertTrue(health.check_redis()['healthy'])
+
+        redis.ConnectionPool.from_url.assert_called_once()
+        self.assertEqual(redis.Redis.return_value.ping.call_count, 2)
+        health.close()
+
+    def test_external_api_probe(self):
+        """Test the Yahoo probe maps HTTP status codes to health"""
+        with mock.patch('common.health._http_session') as session:
+            session.get.return_value.status_code = 200
+            self.assertTrue(self.health.check_external_api()['healthy'])
+
+            session.get.return_value.status_code = 429
+            result = self.health.check_external_api()
+            self.assertFalse(result['healthy'])
+            self.assertIn('429', result['error'])
+
+    def test_external_api_probe_url_is_configurable(self):
+        """Test the probe hits the configured endpoint with the test symbol"""
+        with mock.patch('common.health._http_session') as session, \
+                mock.patch('common.health.YAHOO_PROBE_URL', 'http://proxy.local/quote/{symbol}'):
+            session.get.return_value.status_code = 200
+            self.assertTrue(self.health.check_external_api('MSFT')['healthy'])
+
+        self.assertEqual(session.get.call_args.args[0], 'http://proxy.local/quote/MSFT')
+
+    def test_run_all_checks(self):
+        """Test overall result structure"""
+        result = self.health.run_all_checks(check_db=True, check_disk=True)
+        self.assertEqual(result['service'], 'test-service')
+        self.assertEqual(list(result['checks']), ['database', 'disk_space'])
+        self.assertIn('uptime', result['metrics'])
+
+    def test_system_metrics_do_not_block(self):
+        """Test CPU sampling uses non-blocking deltas"""
+        start = time.monotonic()
+        metrics = self.health.get_system_metrics()
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.1)
+        self.assertIn('process_percent', metrics['cpu'])
+        self.assertEqual(metrics['cpu']['count'], os.cpu_count())
+
+    def test_system_stats_read_once_per_probe(self):
+        """Test disk check and metrics share one psutil snapshot"""
+        with mock.patch.object(self.health, '_snapshot_system',
+                               wraps=self.health._snapshot_system) as snapshot:
+            result = self.health.run_all_checks(check_db=False, check_disk=True)
+
+        snapshot.assert_called_once()
+        self.assertIn('free_gb', result['checks']['disk_space'])
+        self.assertIn('process_mb', result['metrics']['memory'])
+
+    def test_unhealthy_check_fails_overall_status(self):
+        """Test a single failing check marks the service unhealthy"""
+        self.health.check_disk_space = lambda **kwargs: {'status': 'unhealthy', 'healthy': False}
+        result = self.health.run_all_checks(check_db=True, check_disk=True)
+        self.assertEqual(result['status'], 'unhealthy')
+
+    def test_checks_run_concurrently(self):
+        """Test slow checks overlap instead of adding up"""
+        def slow_check(**kwargs):
+            time.sleep(0.3)
+            return {'status': 'healthy', 'healthy': True}
+
+        self.health.check_database = slow_check
+        self.health.check_disk_space = slow_check
+
+        start = time.monotonic()
+        result = self.health.run_all_checks(check_db=True, check_disk=True)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(result['status'], 'healthy')
+        self.assertLess(elapsed, 0.55)
+
+    def test_hung_check_times_out(self):
+        """Test a stalled dependency is reported instead of blocking"""
+        release = threading.Event()
+        health = HealthCheck(service_name='test-service', check_timeout=0.2)
+        health.check_database = lambda: release.wait(5) and {'healthy': True}
+
+        try:
+            start = time.monotonic()
+            result = health.run_all_checks(check_db=True, check_disk=True)
+            elapsed = time.monotonic() - start
+        finally:
+            release.set()
+            health.close()
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(result['status'], 'unhealthy')
+        self.assertEqual(result['checks']['database']['error'], 'timeout')
+        self.assertTrue(result['checks']['disk_space']['healthy'])
+
+    def test_results_are_cached_briefly(self):
+        """Test bursts of probes reuse one round of checks"""
+        calls = []
+
+        def counting_check(**kwargs):
+            calls.append(1)
+            return {'status': 'healthy', 'healthy': True}
+
+        health = HealthCheck(service_name='test-service', cache_ttl_seconds=60)
+        health.check_disk_space = counting_check
+
+        first = health.run_all_checks(check_db=False, check_disk=True)
+        first['checks']['data_service'] = {'healthy': False}
+        second = health.run_all_checks(check_db=False, check_disk=True)
+        health.run_all_checks(check_db=True, check_disk=True)
+        health.close()
+
+        self.assertEqual(len(calls), 2)
+        self.assertNotIn('data_service', second['checks'])
+
+    def test_cache_can_be_disabled(self):
+        """Test a zero TTL runs the checks on every call"""
+        calls = []
+        health = HealthCheck(service_name='test-service', cache_ttl_seconds=0)
+        health.check_disk_space = lambda **kwargs: calls.append(1) or {'healthy': True}
+
+        health.run_all_checks(check_db=False, check_disk=True)
+        health.run_all_checks(check_db=False, check_disk=True)
+        health.close()
+
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
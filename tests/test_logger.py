@@ -57,6 +57,14 @@ class TestStructuredLogger(unittest.TestCase):
         import logging
         self.assertEqual(logger.level, logging.WARNING)
     
+    def test_get_logger_is_cached(self):
+        """Test repeated lookups return the configured logger without new handlers"""
+        logger = get_logger('test-cached')
+        handlers = list(logger.handlers)
+        
+        self.assertIs(get_logger('test-cached'), logger)
+        self.assertEqual(logger.handlers, handlers)
+    
     def test_correlation_id(self):
         """Test correlation ID management"""
         # Set correlation ID
@@ -77,6 +85,21 @@ class TestStructuredLogger(unittest.TestCase):
         set_correlation_id(custom_id)
         self.assertEqual(get_correlation_id(), custom_id)
     
+    def test_correlation_id_isolated_per_task(self):
+        """Test concurrent asyncio tasks keep their own correlation IDs"""
+        import asyncio
+        
+        async def handle(request_id):
+            set_correlation_id(request_id)
+            await asyncio.sleep(0)
+            return get_correlation_id()
+        
+        async def main():
+            return await asyncio.gather(handle('req-1'), handle('req-2'))
+        
+        self.assertEqual(asyncio.run(main()), ['req-1', 'req-2'])
+        self.assertIsNone(get_correlation_id())
+    
     def test_mask_sensitive_data(self):
         """Test sensitive data masking"""
         data = {
@@ -105,6 +128,24 @@ class TestStructuredLogger(unittest.TestCase):
         self.assertEqual(masked['email'], 'john@example.com')
         self.assertEqual(masked['phone'], '***MASKED***')
     
+    def test_mask_matches_key_substrings(self):
+        """Test masking matches sensitive words anywhere in the key, any case"""
+        data = {
+            'X-Auth-Token': 'abc',
+            'DB_PASSWORD': 'secret123',
+            'apiKey': 'key-12345',
+            'ticker': 'AAPL'
+        }
+        
+        masked = mask_sensitive_data(data)
+        
+        self.assertEqual(masked['X-Auth-Token'], '***MASKED***')
+        self.assertEqual(masked['DB_PASSWORD'], '***MASKED***')
+        self.assertEqual(masked['apiKey'], '***MASKED***')
+        self.assertEqual(masked['ticker'], 'AAPL')
+        self.assertEqual(mask_sensitive_data(data, sensitive_keys=[]), data)
+        self.assertEqual(mask_sensitive_data({'a.b': 1, 'ab': 2}, ['a.b']), {'a.b': '***MASKED***', 'ab': 2})
+    
     def test_log_with_extra_fields(self):
         """Test logging with extra fields"""
         # Capture log output
@@ -124,6 +165,22 @@ class TestStructuredLogger(unittest.TestCase):
         output = log_capture.getvalue()
         self.assertIn("Test message", output)
     
+    def test_disabled_level_skips_record_creation(self):
+        """Test log calls below the logger level do no record work"""
+        import logging
+        from unittest import mock
+        
+        os.environ['LOG_LEVEL'] = 'WARNING'
+        logger = get_logger('test-disabled-level')
+        
+        with mock.patch.object(logging.Logger, '_log') as log:
+            logger.debug("Skipped", extra={'key': 'value'})
+            logger.info("Skipped")
+            logger.warning("Emitted", extra={'key': 'value'})
+        
+        log.assert_called_once()
+        self.assertEqual(log.call_args.kwargs['extra'], {'extra_fields': {'key': 'value'}})
+    
     def test_log_execution_time_decorator(self):
         """Test execution time logging decorator"""
         logger = get_logger('test-decorator')
@@ -161,6 +218,10 @@ class TestStructuredLogger(unittest.TestCase):
             logger = get_logger('test-json')
             logger.info("Test JSON log", extra={'key': 'value'})
             
+            # File writes happen on the background listener
+            for handler in logger.handlers:
+                handler.flush()
+            
             # Read the log file
             with open(temp_log_file, 'r') as f:
                 log_line = f.readline()
@@ -180,6 +241,88 @@ class TestStructuredLogger(unittest.TestCase):
             if 'LOG_FILE' in os.environ:
                 del os.environ['LOG_FILE']
     
+    def test_json_formatter_output(self):
+        """Test JSON formatter serializes timestamps and extra fields"""
+        import logging
+        from common.logger import JSONFormatter
+        
+        record = logging.LogRecord('test-json', logging.INFO, 'app.py', 10,
+                                   "Order %s filled", ('42',), None)
+        record.extra_fields = {'ticker': 'AAPL', 'price': 187.5, 'user_id': None}
+        
+        log_data = json.loads(JSONFormatter().format(record))
+        
+        self.assertEqual(log_data['message'], "Order 42 filled")
+        self.assertEqual(log_data['ticker'], 'AAPL')
+        self.assertEqual(log_data['price'], 187.5)
+        self.assertTrue(log_data['timestamp'].endswith('Z'))
+        self.assertNotIn('correlation_id', log_data)
+        self.assertNotIn('user_id', log_data)
+        self.assertNotIn('exception', log_data)
+    
+    def test_json_timestamp_formats(self):
+        """Test cached millisecond timestamps and the exact-timestamp option"""
+        import logging
+        from common.logger import JSONFormatter
+        
+        record = logging.LogRecord('test-json', logging.INFO, 'app.py', 10, "msg", (), None)
+        record.created = 1700000000.123456
+        
+        log_data = json.loads(JSONFormatter().format(record))
+        self.assertEqual(log_data['timestamp'], '2023-11-14T22:13:20.123Z')
+        
+        os.environ['LOG_EXACT_TIMESTAMPS'] = 'true'
+        try:
+            log_data = json.loads(JSONFormatter().format(record))
+        finally:
+            del os.environ['LOG_EXACT_TIMESTAMPS']
+        self.assertEqual(log_data['timestamp'], '2023-11-14T22:13:20.123456Z')
+    
+    def test_pretty_formatter_output(self):
+        """Test pretty formatter layout matches the strftime-based format"""
+        import logging
+        from datetime import datetime
+        from common.logger import PrettyFormatter
+        
+        record = logging.LogRecord('test-pretty', logging.WARNING, 'app.py', 10,
+                                   "Disk almost full", (), None)
+        line = PrettyFormatter().format(record)
+        
+        expected_ts = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        self.assertTrue(line.startswith(f"{expected_ts} | "))
+        self.assertIn(f"\033[33mWARNING \033[0m | {'test-pretty':30} | Disk almost full", line)
+    
+    def test_queued_records_keep_request_context(self):
+        """Test records written by the listener keep correlation ID and traceback"""
+        with tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.log') as f:
+            temp_log_file = f.name
+        
+        try:
+            os.environ['LOG_FILE'] = temp_log_file
+            logger = get_logger('test-queued')
+            
+            set_correlation_id('queued-123')
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.error("Failed %s", 'order', exc_info=True)
+            clear_correlation_id()
+            
+            for handler in logger.handlers:
+                handler.flush()
+            
+            with open(temp_log_file, 'r') as f:
+                log_data = json.loads(f.readline())
+            
+            self.assertEqual(log_data['message'], "Failed order")
+            self.assertEqual(log_data['correlation_id'], 'queued-123')
+            self.assertIn('ValueError: boom', log_data['exception'])
+        
+        finally:
+            if os.path.exists(temp_log_file):
+                os.remove(temp_log_file)
+            os.environ.pop('LOG_FILE', None)
+    
     def test_pretty_format(self):
         """Test pretty log format"""
         os.environ['LOG_FORMAT'] = 'pretty'
@@ -0,0 +1,194 @@
+"""
+Unit tests for the Prometheus metrics helpers
+"""
+import unittest
+import os
+import sys
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from prometheus_client import REGISTRY
+
+from common.metrics import (
+    _normalize_endpoint,
+    initialize_service_metrics,
+    record_health_check,
+    ticker_label,
+    track_request_metrics,
+    track_strategy_execution,
+    track_db_operation
+)
+
+
+def sample(name, **labels):
+    """Current value of a sample in the default registry (0 if absent)"""
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestRequestMetrics(unittest.TestCase):
+    """Test cases for request metric decorators"""
+
+    def test_request_counter_and_duration(self):
+        """Test a decorated call increments the counter and observes duration"""
+        labels = {'service': 'test-svc', 'endpoint': '/test/count', 'method': 'POST'}
+        before = sample('api_requests_total', status='200', **labels)
+        observed_before = sample('request_duration_seconds_count', **labels)
+
+        @track_request_metrics('test-svc', '/test/count')
+        def handler():
+            return {'ok': True}, 200
+
+        handler()
+        handler()
+
+        self.assertEqual(sample('api_requests_total', status='200', **labels), before + 2)
+        self.assertEqual(sample('request_duration_seconds_count', **labels), observed_before + 2)
+
+    def test_error_status_recorded(self):
+        """Test failed calls are counted as 500s and re-raised"""
+        labels = {'service': 'test-svc', 'endpoint': '/test/fail', 'method': 'POST', 'status': '500'}
+        before = sample('api_requests_total', **labels)
+
+        @track_request_metrics('test-svc', '/test/fail')
+        def handler():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            handler()
+
+        self.assertEqual(sample('api_requests_total', **labels), before + 1)
+
+    def test_sampled_recording(self):
+        """Test sampling records every Nth call with the counter scaled by N"""
+        labels = {'service': 'test-svc', 'endpoint': '/test/sampled', 'method': 'POST'}
+
+        @track_request_metrics('test-svc', '/test/sampled', sample_rate=5)
+        def handler():
+            return {'ok': True}, 200
+
+        for _ in range(12):
+            handler()
+
+        self.assertEqual(sample('api_requests_total', status='200', **labels), 10)
+        self.assertEqual(sample('request_duration_seconds_count', **labels), 2)
+
+    def test_endpoint_normalization(self):
+        """Test ID-like path segments collapse into a route template"""
+        self.assertEqual(_normalize_endpoint('/data/fetch'), '/data/fetch')
+        self.assertEqual(_normalize_endpoint('/orders/123/fills'), '/orders/<id>/fills')
+        self.assertEqual(
+            _normalize_endpoint('/jobs/0b6f1c2e-9a1d-4c44-8f3e-2d1a5b7c9e00'),
+            '/jobs/<id>'
+        )
+        self.assertEqual(_normalize_endpoint('/strategies/sma2'), '/strategies/sma2')
+
+
+class TestServiceInitialization(unittest.TestCase):
+    """Test cases for service metric initialization"""
+
+    def test_known_label_combinations_exported(self):
+        """Test known endpoints and operations are exported at zero"""
+        initialize_service_metrics('test-init', endpoints=['/test/init'],
+                                   db_operations=['insert'])
+
+        self.assertEqual(REGISTRY.get_sample_value('api_requests_total', {
+            'service': 'test-init', 'endpoint': '/test/init', 'method': 'POST', 'status': '429'
+        }), 0)
+        self.assertEqual(REGISTRY.get_sample_value('db_operations_total', {
+            'service': 'test-init', 'operation': 'insert', 'status': 'failure'
+        }), 0)
+        self.assertEqual(REGISTRY.get_sample_value('service_up', {'service': 'test-init'}), 1)
+
+    def test_service_handle(self):
+        """Test the returned handle updates the service gauges"""
+        handle = initialize_service_metrics('test-handle')
+
+        handle.up.set(0)
+        handle.heartbeat()
+        handle.set_active_connections(3)
+
+        self.assertEqual(sample('service_up', service='test-handle'), 1)
+        self.assertEqual(sample('active_connections', service='test-handle'), 3)
+
+
+    def test_default_collectors_removed(self):
+        """Test process and GC metrics are not exported by default"""
+        self.assertIsNone(REGISTRY.get_sample_value('process_cpu_seconds_total'))
+        self.assertIsNone(REGISTRY.get_sample_value('python_gc_collections_total', {'generation': '0'}))
+
+
+class TestStrategyMetrics(unittest.TestCase):
+    """Test cases for strategy execution metrics"""
+
+    def test_backtest_results_recorded(self):
+        """Test trades, return and Sharpe ratio are taken from the result"""
+        labels = {'strategy': 'test-sma', 'ticker': 'TEST'}
+        trades_before = sample('backtest_trades_total', **labels)
+
+        @track_strategy_execution('test-sma', 'TEST')
+        def run_backtest():
+            return {'total_trades': 4, 'total_return': 12.5, 'sharpe_ratio': 1.3}
+
+        run_backtest()
+
+        self.assertEqual(sample('backtest_trades_total', **labels), trades_before + 4)
+        self.assertEqual(sample('backtest_return_percent_bucket', le='50.0', **labels), 1)
+        self.assertEqual(sample('backtest_sharpe_ratio', **labels), 1.3)
+        self.assertEqual(sample('strategy_execution_duration_seconds_count', **labels), 1)
+
+
+class TestLabelCardinality(unittest.TestCase):
+    """Test cases for label cardinality limits"""
+
+    def test_ticker_labels_are_capped(self):
+        """Test tickers beyond the cap are recorded as 'other'"""
+        with mock.patch('common.metrics.MAX_TICKER_LABELS', 2), \
+                mock.patch('common.metrics._ticker_labels', set()):
+            self.assertEqual(ticker_label('AAPL'), 'AAPL')
+            self.assertEqual(ticker_label('MSFT'), 'MSFT')
+            self.assertEqual(ticker_label('TSLA'), 'other')
+            self.assertEqual(ticker_label('AAPL'), 'AAPL')
+
+
+class TestDbOperationMetrics(unittest.TestCase):
+    """Test cases for database operation metrics"""
+
+    def test_db_operation_status(self):
+        """Test success and failure are counted separately"""
+        labels = {'service': 'test-svc', 'operation': 'select'}
+        success_before = sample('db_operations_total', status='success', **labels)
+        failure_before = sample('db_operations_total', status='failure', **labels)
+
+        @track_db_operation('test-svc', 'select')
+        def query(fail=False):
+            if fail:
+                raise ValueError("bad query")
+            return []
+
+        query()
+        with self.assertRaises(ValueError):
+            query(fail=True)
+
+        self.assertEqual(sample('db_operations_total', status='success', **labels), success_before + 1)
+        self.assertEqual(sample('db_operations_total', status='failure', **labels), failure_before + 1)
+
+
+class TestHealthCheckMetrics(unittest.TestCase):
+    """Test cases for health check metrics"""
+
+    def test_health_check_recorded(self):
+        """Test duration and status are recorded per check type"""
+        labels = {'service': 'test-svc', 'check_type': 'database'}
+
+        record_health_check('test-svc', 'database', 0.2, True)
+        self.assertEqual(sample('health_check_status', **labels), 1)
+
+        record_health_check('test-svc', 'database', 0.3, False)
+        self.assertEqual(sample('health_check_status', **labels), 0)
+        self.assertEqual(sample('health_check_duration_seconds_count', **labels), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
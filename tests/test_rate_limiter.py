@@ -0,0 +1,247 @@
+"""
+Unit tests for the Redis token bucket rate limiter
+"""
+import unittest
+import os
+import sys
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask import Flask
+
+from common.rate_limiter import (
+    RateLimiter, RateLimitResult, TOKEN_BUCKET_LUA, init_rate_limiter, rate_limit
+)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for RateLimiter against a mocked Redis client"""
+
+    def setUp(self):
+        """Create a limiter whose Redis client is a mock"""
+        mock.patch('common.rate_limiter.redis.BlockingConnectionPool').start()
+        self.redis = mock.patch('common.rate_limiter.redis.Redis').start().return_value
+        self.addCleanup(mock.patch.stopall)
+        self.script = self.redis.register_script.return_value
+        self.limiter = RateLimiter('redis://test:6379/0')
+
+    def test_bounded_connection_pool(self):
+        """Test the client uses a blocking pool with a connection cap"""
+        from common.rate_limiter import redis as redis_module
+
+        kwargs = redis_module.BlockingConnectionPool.from_url.call_args.kwargs
+        self.assertIn('max_connections', kwargs)
+        self.assertNotIn('decode_responses', kwargs)
+
+    def test_script_registered_once(self):
+        """Test the token bucket script is registered at init"""
+        self.assertTrue(self.limiter.enabled)
+        self.redis.register_script.assert_called_once_with(TOKEN_BUCKET_LUA)
+
+    def test_allowed_request(self):
+        """Test an allowed check is a single script call"""
+        self.script.return_value = [1, b'9']
+
+        result = self.limiter.check_rate_limit('api', '1.2.3.4', calls=60, period=60, burst=10)
+
+        self.assertTrue(result.allowed)
+        self.assertEqual(result.tokens_remaining, 9)
+        self.assertEqual(result.retry_after, 0)
+        kwargs = self.script.call_args.kwargs
+        self.assertEqual(kwargs['keys'], [b'rate_limit:api:1.2.3.4:tokens',
+                                          b'rate_limit:api:1.2.3.4:timestamp'])
+        self.assertEqual(kwargs['args'][1:], [10, 1.0, 120, 1])
+        self.redis.pipeline.assert_not_called()
+
+    def test_denied_request(self):
+        """Test an empty bucket reports when to retry"""
+        self.script.return_value = [0, b'0.5']
+
+        result = self.limiter.check_rate_limit('api', 'client', calls=30, period=60, burst=10)
+
+        self.assertFalse(result.allowed)
+        self.assertEqual(result.tokens_remaining, 0)
+        self.assertEqual(result.retry_after, 2)
+
+    def test_local_lease_skips_redis(self):
+        """Test leased tokens are spent locally before returning to Redis"""
+        limiter = RateLimiter('redis://test:6379/0', local_batch=3)
+        self.script.return_value = [3, b'5']
+
+        results = [limiter.check_rate_limit('api', 'client', calls=60, period=60, burst=10)
+                   for _ in range(4)]
+
+        self.assertTrue(all(result.allowed for result in results))
+        self.assertEqual([result.tokens_remaining for result in results], [7, 6, 5, 7])
+        self.assertEqual(self.script.call_count, 2)
+        self.assertEqual(self.script.call_args.kwargs['args'][-1], 3)
+
+    def test_expired_lease_goes_to_redis(self):
+        """Test unused leased tokens are not spent after the lease expires"""
+        limiter = RateLimiter('redis://test:6379/0', local_batch=3, local_ttl=0)
+        self.script.return_value = [3, b'5']
+
+        limiter.check_rate_limit('api', 'client')
+        limiter.check_rate_limit('api', 'client')
+
+        self.assertEqual(self.script.call_count, 2)
+
+    def test_fails_open_on_redis_error(self):
+        """Test Redis errors allow the request"""
+        self.script.side_effect = ConnectionError("redis down")
+
+        result = self.limiter.check_rate_limit('api', 'client')
+
+        self.assertTrue(result.allowed)
+        self.assertEqual(result.skipped, 'rate_limit_check_failed')
+
+    def test_stats_read_bucket_once(self):
+        """Test stats and reset time come from a single read"""
+        self.redis.mget.return_value = [b'4', None]
+
+        stats = self.limiter.get_stats('api', 'client', calls=60, period=60, burst=10)
+
+        self.redis.mget.assert_called_once()
+        self.assertEqual(stats['tokens_remaining'], 4)
+        self.assertEqual(stats['reset_time'], 7)
+
+    def test_reset_limit_single_command(self):
+        """Test resetting a bucket deletes both keys in one command"""
+        self.assertTrue(self.limiter.reset_limit('api', 'client'))
+
+        self.redis.delete.assert_called_once_with(b'rate_limit:api:client:tokens',
+                                                  b'rate_limit:api:client:timestamp')
+        self.redis.pipeline.assert_not_called()
+
+    def test_disabled_without_redis(self):
+        """Test the limiter allows everything when Redis is unreachable"""
+        self.redis.ping.side_effect = ConnectionError("refused")
+        limiter = RateLimiter('redis://test:6379/0')
+
+        result = limiter.check_rate_limit('api', 'client')
+
+        self.assertFalse(limiter.enabled)
+        self.assertTrue(result.allowed)
+        self.assertEqual(result.skipped, 'disabled')
+
+
+class TestRateLimitDecorator(unittest.TestCase):
+    """Test cases for the rate_limit decorator"""
+
+    def setUp(self):
+        """Create an app and a mock limiter"""
+        self.app = Flask(__name__)
+        self.limiter = mock.Mock()
+        self.limiter.check_rate_limit.return_value = RateLimitResult(True, 5, 0)
+
+    def test_explicit_limiter(self):
+        """Test a limiter passed to the decorator is used directly"""
+        @rate_limit(calls=10, resource='test', limiter=self.limiter)
+        def view():
+            return 'ok'
+
+        with self.app.test_request_context():
+            self.assertEqual(view(), 'ok')
+
+        self.limiter.check_rate_limit.assert_called_once()
+
+    def test_limiter_resolved_per_app(self):
+        """Test each app's requests use that app's own limiter"""
+        other_app = Flask(__name__)
+        other_limiter = mock.Mock()
+        other_limiter.check_rate_limit.return_value = RateLimitResult(True, 5, 0)
+        self.app.rate_limiter = self.limiter
+        other_app.rate_limiter = other_limiter
+
+        @rate_limit(calls=10, resource='test')
+        def view():
+            return 'ok'
+
+        with self.app.test_request_context():
+            view()
+        with other_app.test_request_context():
+            view()
+
+        self.limiter.check_rate_limit.assert_called_once()
+        other_limiter.check_rate_limit.assert_called_once()
+
+    @mock.patch('common.rate_limiter.init_rate_limiter')
+    def test_limiter_created_on_first_request(self, init):
+        """Test an app without a limiter gets one from init_rate_limiter"""
+        init.side_effect = lambda app: setattr(app, 'rate_limiter', self.limiter)
+
+        @rate_limit(calls=10, resource='test')
+        def view():
+            return 'ok'
+
+        with self.app.test_request_context():
+            view()
+        with self.app.test_request_context():
+            view()
+
+        init.assert_called_once_with(self.app)
+        self.assertEqual(self.limiter.check_rate_limit.call_count, 2)
+
+    def test_denied_request_returns_429(self):
+        """Test a denied check returns a 429 with retry headers"""
+        self.limiter.check_rate_limit.return_value = RateLimitResult(False, 0, 100, 3)
+
+        @rate_limit(calls=10, resource='test', limiter=self.limiter)
+        def view():
+            return 'ok'
+
+        with self.app.test_request_context():
+            response = view()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers['Retry-After'], '3')
+        self.assertEqual(response.get_json()['retry_after'], 3)
+
+    def test_missing_limiter_allows_request(self):
+        """Test requests pass through when the app has no limiter"""
+        self.app.rate_limiter = None
+
+        @rate_limit(calls=10, resource='test')
+        def view():
+            return 'ok'
+
+        with self.app.test_request_context():
+            self.assertEqual(view(), 'ok')
+
+    def test_explicit_limiter_skips_current_app(self):
+        """Test a limiter passed to the decorator never touches current_app"""
+        proxy = mock.Mock()
+        proxy._get_current_object.side_effect = RuntimeError('current_app used')
+
+        @rate_limit(calls=10, resource='test', limiter=self.limiter)
+        def limited():
+            return 'ok'
+
+        @rate_limit(calls=10, resource='test', limiter=None)
+        def unlimited():
+            return 'ok'
+
+        with self.app.test_request_context(), \
+                mock.patch('common.rate_limiter.current_app', proxy):
+            self.assertEqual(limited(), 'ok')
+            self.assertEqual(unlimited(), 'ok')
+
+        proxy._get_current_object.assert_not_called()
+        self.limiter.check_rate_limit.assert_called_once()
+
+    @mock.patch('common.rate_limiter.redis.Redis')
+    @mock.patch('common.rate_limiter.redis.BlockingConnectionPool')
+    def test_init_rate_limiter_uses_app_config(self, pool, _redis):
+        """Test init_rate_limiter reads REDIS_URL from the app config"""
+        self.app.config['REDIS_URL'] = 'redis://configured:6379/1'
+
+        limiter = init_rate_limiter(self.app)
+
+        self.assertIs(self.app.rate_limiter, limiter)
+        self.assertEqual(pool.from_url.call_args.args[0], 'redis://configured:6379/1')
+
+
+if __name__ == '__main__':
+    unittest.main()